@@ -18,6 +18,7 @@ Environment variables (see .env.example):
   DATA_DIR             Directory for completed registration JSON  (default: data/)
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -59,6 +60,7 @@ _notifier = AdminNotifier(
     outdoor_email=_config.admin_email_outdoor,
     cc_emails=[e.strip() for e in _config.admin_email_cc.split(",") if e.strip()],
     model=_config.simple_model,
+    background=True,
 )
 
 # ---------------------------------------------------------------------------
@@ -210,6 +212,12 @@ async def on_chat_end() -> None:
         )
 
 
+@cl.on_app_shutdown
+async def on_app_shutdown() -> None:
+    """Flush queued notification emails and close the pooled SMTP sessions."""
+    await asyncio.to_thread(_notifier.close)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
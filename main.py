@@ -62,6 +62,7 @@ def build_components(config: Config):
         outdoor_email=config.admin_email_outdoor,
         cc_emails=[e.strip() for e in config.admin_email_cc.split(",") if e.strip()],
         model=config.simple_model,
+        background=True,
     )
 
     agent = EmailAgent(
@@ -84,7 +85,7 @@ def build_components(config: Config):
         registration_email=config.registration_email,
     )
 
-    return agent, channel
+    return agent, channel, notifier
 
 
 def run_poll_loop(agent: EmailAgent, channel: EmailChannel, poll_interval: int) -> None:
@@ -166,8 +167,12 @@ def main() -> None:
         )
         sys.exit(1)
 
-    agent, channel = build_components(config)
-    run_poll_loop(agent, channel, config.poll_interval)
+    agent, channel, notifier = build_components(config)
+    try:
+        run_poll_loop(agent, channel, config.poll_interval)
+    finally:
+        # Let queued notifications go out and log out of the SMTP sessions.
+        notifier.close()
 
 
 if __name__ == "__main__":
@@ -63,6 +63,11 @@ def _extract_text(msg: email.message.Message) -> str:
     return ""
 
 
+# Lines at which a quoted reply starts: separator rules, then the attribution
+# lines of English and German (Outlook/Thunderbird) mail clients.
+_REPLY_SEPARATOR_RE = re.compile(r"-{3,}|_{3,}|={3,}|On .+ wrote:$|Am .+ schrieb .+:$")
+
+
 def _strip_quoted_text(text: str) -> str:
     """Remove quoted reply text from the email body.
 
@@ -77,11 +82,7 @@ def _strip_quoted_text(text: str) -> str:
         if stripped.startswith(">"):
             continue
         # Common separators used by email clients
-        if re.match(r"^-{3,}|^_{3,}|^={3,}", stripped):
-            break
-        if re.match(r"^On .+ wrote:$", stripped):
-            break
-        if re.match(r"^Am .+ schrieb .+:$", stripped):  # German Outlook/Thunderbird
+        if _REPLY_SEPARATOR_RE.match(stripped):
             break
         if "-----Original Message-----" in stripped:
             break
@@ -247,14 +248,16 @@ class EmailChannel:
                     in_reply_to = msg.get("In-Reply-To", "").strip()
                     references = msg.get("References", "").strip()
 
-                    raw_body = _extract_text(msg)
-                    body = _strip_quoted_text(raw_body)
-
-                    if not body.strip():
-                        imap.store(num, "+FLAGS", "\\Seen")
-                        continue
-
                     is_automated, automated_reason = detect_automated_message(msg, from_addr)
+                    if is_automated:
+                        # Never answered, so the body is not worth decoding.
+                        raw_body = body = ""
+                    else:
+                        raw_body = _extract_text(msg)
+                        body = _strip_quoted_text(raw_body)
+                        if not body.strip():
+                            imap.store(num, "+FLAGS", "\\Seen")
+                            continue
 
                     messages.append(
                         {
@@ -316,6 +319,12 @@ class EmailChannel:
         if quoted_text.strip():
             body = body + _build_quoted_block(quoted_text, quoted_from or to)
 
+        if not self._smtp_host:
+            # Dev mode: log only, without encoding a MIME message nobody sends.
+            logger.warning("SMTP not configured — reply NOT sent to %s: %s", to, subject)
+            logger.debug("Reply body:\n%s", body)
+            return new_message_id
+
         msg = MIMEMultipart("alternative")
         msg["From"] = self._from_email
         msg["To"] = to
@@ -328,11 +337,6 @@ class EmailChannel:
 
         msg.attach(MIMEText(body, "plain", "utf-8"))
 
-        if not self._smtp_host:
-            logger.warning("SMTP not configured — reply NOT sent to %s: %s", to, subject)
-            logger.debug("Reply body:\n%s", body)
-            return new_message_id
-
         try:
             if self._use_tls:
                 server = smtplib.SMTP(self._smtp_host, self._smtp_port)
@@ -12,6 +12,7 @@ class KnowledgeBase:
     def __init__(self, kb_dir: Path) -> None:
         self._dir = kb_dir
         self._content: dict[str, str] = {}
+        self._all: str | None = None   # get_all() result, rebuilt after reload()
         self._load()
 
     def _load(self) -> None:
@@ -24,6 +25,11 @@ class KnowledgeBase:
 
     def get_all(self) -> str:
         """Return every KB file concatenated with section headers."""
+        if self._all is None:
+            self._all = self._join()
+        return self._all
+
+    def _join(self) -> str:
         if not self._content:
             return "(No knowledge-base content available.)"
         sections = [
@@ -35,4 +41,5 @@ class KnowledgeBase:
     def reload(self) -> None:
         """Re-read all files from disk (useful when admins update content)."""
         self._content = {}
+        self._all = None
         self._load()
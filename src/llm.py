@@ -5,6 +5,15 @@ from collections.abc import Generator
 import litellm
 
 
+def _api_messages(system: str, messages: list) -> list[dict]:
+    """Build the litellm message list: the system prompt, then the history."""
+    # Single pass into one list; chat histories grow with every turn.
+    return [
+        {"role": "system", "content": system},
+        *({"role": m.role, "content": m.content} for m in messages),
+    ]
+
+
 async def acomplete(
     model: str,
     system: str,
@@ -27,8 +36,7 @@ async def acomplete(
     Returns:
         The model's reply as a plain string.
     """
-    api_messages = [{"role": "system", "content": system}]
-    api_messages += [{"role": m.role, "content": m.content} for m in messages]
+    api_messages = _api_messages(system, messages)
 
     kwargs: dict = {"model": model, "messages": api_messages, "max_tokens": 2048}
     if thinking_budget is not None:
@@ -61,8 +69,7 @@ def complete(
     Returns:
         The model's reply as a plain string.
     """
-    api_messages = [{"role": "system", "content": system}]
-    api_messages += [{"role": m.role, "content": m.content} for m in messages]
+    api_messages = _api_messages(system, messages)
 
     kwargs: dict = {"model": model, "messages": api_messages, "max_tokens": 2048}
     if thinking_budget is not None:
@@ -87,8 +94,7 @@ def stream_complete(
     Yields:
         Non-empty text chunks from the model's streamed response.
     """
-    api_messages = [{"role": "system", "content": system}]
-    api_messages += [{"role": m.role, "content": m.content} for m in messages]
+    api_messages = _api_messages(system, messages)
     response = litellm.completion(
         model=model, messages=api_messages, max_tokens=2048, stream=True
     )
@@ -11,8 +11,9 @@ def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
+    # Immutable value object; slotted because histories hold one per turn.
     role: str      # "user" or "assistant"
     content: str
     timestamp: str = field(default_factory=_now)
@@ -48,22 +48,31 @@ class RegistrationData:
     booking: Booking = field(default_factory=Booking)
 
     def is_complete(self) -> bool:
-        """Return True when all required schema fields are present."""
-        return (
-            bool(self.child.full_name)
-            and bool(self.child.date_of_birth)
-            and self.child.special_needs is not None
-            and self.child.trial_day_completed is True
-            and bool(self.parent_guardian.full_name)
-            and bool(self.parent_guardian.street_address)
-            and bool(self.parent_guardian.postal_code)
-            and bool(self.parent_guardian.city)
-            and bool(self.parent_guardian.phone)
-            and bool(self.parent_guardian.email)
-            and bool(self.emergency_contact.full_name)
-            and bool(self.emergency_contact.phone)
-            and len(self.booking.playgroup_types) > 0
-            and len(self.booking.selected_days) > 0
+        """Return True when all required schema fields are present.
+
+        Checks are ordered roughly by collection order in the conversation
+        flow, so an in-progress registration fails on the first field that
+        is still empty.
+        """
+        child = self.child
+        pg = self.parent_guardian
+        ec = self.emergency_contact
+        booking = self.booking
+        return bool(
+            child.full_name
+            and child.date_of_birth
+            and booking.playgroup_types
+            and booking.selected_days
+            and child.trial_day_completed is True
+            and child.special_needs is not None
+            and pg.full_name
+            and pg.street_address
+            and pg.postal_code
+            and pg.city
+            and pg.phone
+            and pg.email
+            and ec.full_name
+            and ec.phone
         )
 
     def to_dict(self) -> dict:
@@ -121,7 +130,7 @@ class RegistrationData:
             )
         if booking := data.get("booking", {}):
             reg.booking = Booking(
-                playgroup_types=booking.get("playgroupTypes", []),
+                playgroup_types=list(booking.get("playgroupTypes", [])),
                 selected_days=[
                     BookingDay(day=d["day"], type=d["type"])
                     for d in booking.get("selectedDays", [])
@@ -1,6 +1,8 @@
 """Pure functions for building email context dicts from registration data."""
 
-from datetime import date, datetime
+from collections.abc import Mapping
+from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from ..models.registration import RegistrationData
 
@@ -26,78 +28,123 @@ ADMIN_NAME = "Markus Graf"
 ADMIN_PHONE = "079 261 16 37"
 ADMIN_EMAIL = "spielgruppen@familien-verein.ch"
 
+_DAY_LABELS_DE = {"monday": "Montag", "wednesday": "Mittwoch", "thursday": "Donnerstag"}
+_TYPE_LABELS_DE = {"indoor": "Innenspielgruppe", "outdoor": "Waldspielgruppe"}
+
+PLAYGROUP_TYPES = frozenset({"indoor", "outdoor"})
+
+# Admin-email label for each combination of booked playgroup types.
+_TYPE_GROUP_LABELS_DE = {
+    frozenset(): "Spielgruppe",
+    frozenset({"indoor"}): "Innenspielgruppe",
+    frozenset({"outdoor"}): "Waldspielgruppe",
+    PLAYGROUP_TYPES: "Innen- und Waldspielgruppe",
+}
+
+# Monthly fee in CHF per booked weekly day, by playgroup type.
+_FEE_PER_DAY = {"indoor": 130, "outdoor": 250}
+
 # ---------------------------------------------------------------------------
 # Formatting helpers (pure functions, no side-effects)
 # ---------------------------------------------------------------------------
 
 
+def dob_info(dob_str: str) -> tuple[str, str]:
+    """Return ``(DD.MM.YYYY, 'X Jahre, Y Monate')`` from a YYYY-MM-DD string.
+
+    The date is parsed once for both values.  On invalid input both values
+    are the original string.
+    """
+    return _dob_info(dob_str or "", date.today().toordinal())
+
+
+@lru_cache(maxsize=1024)
+def _dob_info(dob_str: str, today_ordinal: int) -> tuple[str, str]:
+    # Keyed on today's ordinal so cached ages roll over at midnight.
+    try:
+        # strptime, not fromisoformat: LLM-extracted dates like "2022-1-5"
+        # are not zero-padded.
+        dob = datetime.strptime(dob_str, "%Y-%m-%d").date()
+    except ValueError:
+        return dob_str, dob_str
+    today = date.fromordinal(today_ordinal)
+    years = today.year - dob.year - (
+        (today.month, today.day) < (dob.month, dob.day)
+    )
+    months = (today.month - dob.month) % 12
+    return dob.strftime("%d.%m.%Y"), f"{years} Jahre, {months} Monate"
+
+
 def format_dob(dob_str: str) -> str:
     """Return DD.MM.YYYY from a YYYY-MM-DD string, or the original on error."""
-    try:
-        return datetime.strptime(dob_str, "%Y-%m-%d").strftime("%d.%m.%Y")
-    except Exception:
-        return dob_str or ""
+    return dob_info(dob_str)[0]
 
 
 def calculate_age(dob_str: str) -> str:
     """Return 'X Jahre, Y Monate' from a YYYY-MM-DD string."""
-    try:
-        dob = datetime.strptime(dob_str, "%Y-%m-%d").date()
-        today = date.today()
-        years = today.year - dob.year - (
-            (today.month, today.day) < (dob.month, dob.day)
-        )
-        months = (today.month - dob.month) % 12
-        return f"{years} Jahre, {months} Monate"
-    except Exception:
-        return dob_str
+    return dob_info(dob_str)[1]
 
 
 def format_types(types: list[str]) -> str:
     """German label for a list of playgroup type keys (admin emails)."""
-    has_indoor = "indoor" in types
-    has_outdoor = "outdoor" in types
-    if has_indoor and has_outdoor:
-        return "Innen- und Waldspielgruppe"
-    if has_indoor:
-        return "Innenspielgruppe"
-    if has_outdoor:
-        return "Waldspielgruppe"
-    return "Spielgruppe"
-
-
-def format_types_i18n(types: list[str], strings: dict) -> str:
+    key = frozenset(types)
+    label = _TYPE_GROUP_LABELS_DE.get(key)
+    if label is None:
+        label = _TYPE_GROUP_LABELS_DE[key & PLAYGROUP_TYPES]
+    return label
+
+
+def format_types_i18n(types: list[str], strings: Mapping) -> str:
     """Localised label for playgroup type keys using the supplied string table."""
-    type_map: dict = strings["types"]
+    type_map: Mapping = strings["types"]
     labels = [type_map.get(t, t) for t in types]
     return ", ".join(labels) if labels else ""
 
 
+def _booking_key(registration: RegistrationData) -> tuple[tuple[str, str], ...]:
+    """Hashable snapshot of the selected days, used as a memoization key."""
+    return tuple((d.day, d.type) for d in registration.booking.selected_days)
+
+
 def format_days(registration: RegistrationData) -> str:
     """German day + type labels for admin emails."""
-    day_map = {"monday": "Montag", "wednesday": "Mittwoch", "thursday": "Donnerstag"}
-    type_map = {"indoor": "Innenspielgruppe", "outdoor": "Waldspielgruppe"}
-    return ", ".join(
-        f"{day_map.get(d.day, d.day.capitalize())} ({type_map.get(d.type, d.type)})"
-        for d in registration.booking.selected_days
-    )
+    return _format_days_de(_booking_key(registration))
+
 
+@lru_cache(maxsize=256)
+def _format_days_de(days: tuple[tuple[str, str], ...]) -> str:
+    return _join_day_labels(days, _DAY_LABELS_DE, _TYPE_LABELS_DE)
 
-def format_days_i18n(registration: RegistrationData, strings: dict) -> str:
+
+def format_days_i18n(registration: RegistrationData, strings: Mapping) -> str:
     """Localised day + type labels using the supplied string table."""
-    day_map: dict = strings["days"]
-    type_map: dict = strings["types"]
+    return _join_day_labels(_booking_key(registration), strings["days"], strings["types"])
+
+
+def _join_day_labels(
+    days: tuple[tuple[str, str], ...],
+    day_labels: Mapping,
+    type_labels: Mapping,
+) -> str:
+    # Bind the lookups once; capitalize() only runs for unlabelled days.
+    day_label = day_labels.get
+    type_label = type_labels.get
     return ", ".join(
-        f"{day_map.get(d.day, d.day.capitalize())} ({type_map.get(d.type, d.type)})"
-        for d in registration.booking.selected_days
+        f"{day_label(day) or day.capitalize()} ({type_label(type_, type_)})"
+        for day, type_ in days
     )
 
 
 def calculate_monthly_fee(registration: RegistrationData) -> str:
     """Compute the monthly fee string from the booking selection."""
-    indoor_days = sum(1 for d in registration.booking.selected_days if d.type == "indoor")
-    outdoor_days = sum(1 for d in registration.booking.selected_days if d.type == "outdoor")
-    fee = indoor_days * 130 + outdoor_days * 250
+    return _monthly_fee(_booking_key(registration))
+
+
+@lru_cache(maxsize=256)
+def _monthly_fee(days: tuple[tuple[str, str], ...]) -> str:
+    fee = 0
+    for _, type_ in days:
+        fee += _FEE_PER_DAY.get(type_, 0)
     return f"CHF {fee}.-"
 
 
@@ -106,6 +153,12 @@ def calculate_monthly_fee(registration: RegistrationData) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _utc_timestamp() -> tuple[str, str]:
+    """Return the current UTC date and time as ``("DD.MM.YYYY", "HH:MM")``."""
+    date_str, time_str = datetime.now(timezone.utc).strftime("%d.%m.%Y %H:%M").split(" ")
+    return date_str, time_str
+
+
 def build_admin_new_context(
     registration: RegistrationData,
     registration_id: str,
@@ -113,21 +166,22 @@ def build_admin_new_context(
     channel: str,
 ) -> dict:
     """Build the template context for the admin new-registration email."""
-    now = datetime.utcnow()
+    submitted_date, submitted_time = _utc_timestamp()
     pg = registration.parent_guardian
     ec = registration.emergency_contact
     ch = registration.child
     channel_de = {"email": "E-Mail", "chat": "Chat"}.get(channel.lower(), channel.title())
+    child_dob, child_age = dob_info(ch.date_of_birth or "")
 
     return {
-        "submitted_date": now.strftime("%d.%m.%Y"),
-        "submitted_time": now.strftime("%H:%M"),
+        "submitted_date": submitted_date,
+        "submitted_time": submitted_time,
         "channel": channel_de,
         "registration_id": registration_id,
         "version": version,
         "child_name": ch.full_name or "",
-        "child_dob": format_dob(ch.date_of_birth or ""),
-        "child_age": calculate_age(ch.date_of_birth or ""),
+        "child_dob": child_dob,
+        "child_age": child_age,
         "child_needs": ch.special_needs or "Keine",
         "playgroup_types": format_types(registration.booking.playgroup_types),
         "days": format_days(registration),
@@ -147,20 +201,24 @@ def build_admin_update_context(
     registration: RegistrationData,
     registration_id: str,
     version: int,
-    change_summary: dict,
+    change_summary: dict[str, tuple],
 ) -> dict:
-    """Build the template context for the admin registration-update email."""
-    now = datetime.utcnow()
+    """Build the template context for the admin registration-update email.
+
+    *change_summary* maps field_path → (old_value, new_value) and must already
+    be in display order; ``_diff_registrations`` emits it sorted by field path.
+    """
+    updated_date, updated_time = _utc_timestamp()
     pg = registration.parent_guardian
 
     changes = [
-        {"field": field_path, "old": values["old"], "new": values["new"]}
-        for field_path, values in sorted(change_summary.items())
+        {"field": field_path, "old": old, "new": new}
+        for field_path, (old, new) in change_summary.items()
     ]
 
     return {
-        "updated_date": now.strftime("%d.%m.%Y"),
-        "updated_time": now.strftime("%H:%M"),
+        "updated_date": updated_date,
+        "updated_time": updated_time,
         "registration_id": registration_id,
         "version": version,
         "child_name": registration.child.full_name or "",
@@ -179,7 +237,7 @@ def build_admin_update_context(
 
 def build_parent_context(
     registration: RegistrationData,
-    strings: dict,
+    strings: Mapping,
     has_qr: bool = True,
 ) -> dict:
     """Build the template context for the parent confirmation email."""
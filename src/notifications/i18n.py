@@ -8,7 +8,10 @@ maintain, any language the parent writes in is supported automatically.
 
 import json
 import logging
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 import litellm
 import yaml
@@ -17,8 +20,9 @@ logger = logging.getLogger(__name__)
 
 _I18N_DIR = Path(__file__).parent / "i18n"
 
-# In-memory translation cache keyed by language code.
-_cache: dict[str, dict] = {}
+# In-memory translation cache keyed by language code.  String tables are
+# shared between callers, so they are handed out as read-only mappings.
+_cache: dict[str, Mapping] = {}
 
 # Pure data values that must never be sent to the LLM for translation.
 _PASSTHROUGH_KEYS = {"reg_fee_amount", "deposit_amount"}
@@ -35,12 +39,13 @@ Rules:
 - Do not include any explanation or text outside the JSON."""
 
 
-def get_strings(language: str, model: str) -> dict:
+def get_strings(language: str, model: str) -> Mapping:
     """Return the label string table for *language*.
 
     For German, loads directly from de.yaml (no LLM call).
     For all other languages, translates the German labels via LLM and caches
     the result in memory.  Falls back to German if the LLM call fails.
+    The returned table is read-only.
     """
     if language == "de":
         return _load_german()
@@ -59,12 +64,21 @@ def clear_cache() -> None:
     _cache.clear()
 
 
-def _load_german() -> dict:
+@lru_cache(maxsize=1)
+def _load_german() -> Mapping:
+    # de.yaml ships with the package, so it is parsed once per process.
     with (_I18N_DIR / "de.yaml").open(encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
+        return _freeze(yaml.safe_load(fh))
 
 
-def _translate(german: dict, language: str, model: str) -> dict:
+def _freeze(table: dict) -> Mapping:
+    """Wrap *table* and its nested tables (``days``, ``types``) read-only."""
+    return MappingProxyType(
+        {k: _freeze(v) if isinstance(v, dict) else v for k, v in table.items()}
+    )
+
+
+def _translate(german: Mapping, language: str, model: str) -> Mapping:
     """Translate the German label dict into *language* via LLM.
 
     Returns the German dict unchanged if the LLM call fails or returns
@@ -74,7 +88,7 @@ def _translate(german: dict, language: str, model: str) -> dict:
     to_translate = {k: v for k, v in german.items() if k not in _PASSTHROUGH_KEYS}
 
     system = _SYSTEM_PROMPT.format(language=language)
-    payload = json.dumps(to_translate, ensure_ascii=False, indent=2)
+    payload = json.dumps(to_translate, ensure_ascii=False, indent=2, default=dict)
 
     try:
         response = litellm.completion(
@@ -94,7 +108,7 @@ def _translate(german: dict, language: str, model: str) -> dict:
 
         translated: dict = json.loads(raw)
         translated.update(passthrough)
-        return translated
+        return _freeze(translated)
 
     except Exception:
         logger.exception(
@@ -10,9 +10,19 @@ _env = Environment(
     loader=FileSystemLoader(str(_TEMPLATES_DIR)),
     autoescape=select_autoescape(enabled_extensions=["html.j2"]),
     keep_trailing_newline=True,
+    # Templates ship with the package; skip the per-render mtime check and
+    # serve the compiled template straight from the environment cache.
+    auto_reload=False,
 )
 
 
+# Compile every shipped template once at import so the first email of a
+# process does not pay for template parsing, and later renders skip the
+# environment's cache lookup.
+_templates = {name: _env.get_template(name) for name in _env.list_templates()}
+
+
 def render_template(name: str, context: dict) -> str:
     """Render *name* (relative to the templates directory) with *context*."""
-    return _env.get_template(name).render(**context)
+    template = _templates.get(name) or _env.get_template(name)
+    return template.render(**context)
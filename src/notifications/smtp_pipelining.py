@@ -0,0 +1,87 @@
+"""ESMTP PIPELINING (RFC 2920) for notification sends.
+
+``smtplib`` issues MAIL FROM, each RCPT TO and DATA one at a time, waiting a
+full round-trip for every reply.  When the server advertises PIPELINING the
+envelope commands can be written in a single batch and the replies read back
+in order afterwards, saving one round-trip per recipient plus one for DATA.
+"""
+
+import logging
+import re
+import smtplib
+from email.message import EmailMessage
+
+logger = logging.getLogger(__name__)
+
+_CRLF = b"\r\n"
+_LEADING_DOT = re.compile(rb"(?m)^\.")
+_BARE_EOL = re.compile(rb"(?:\r\n|\n|\r(?!\n))")
+
+
+def send_pipelined(
+    server: smtplib.SMTP,
+    msg: EmailMessage,
+    from_addr: str,
+    to_addrs: list[str],
+) -> dict:
+    """Send *msg* over *server*, pipelining the envelope when supported.
+
+    Falls back to ``server.send_message`` when the server does not advertise
+    PIPELINING or the envelope needs SMTPUTF8.  Mirrors ``smtplib.sendmail``:
+    returns a dict of refused recipients and raises ``SMTPSenderRefused``,
+    ``SMTPRecipientsRefused`` or ``SMTPDataError`` on failure.
+    """
+    server.ehlo_or_helo_if_needed()
+    addrs = [from_addr, *to_addrs]
+    features = server.esmtp_features
+    if "pipelining" not in features or not all(a.isascii() for a in addrs):
+        return server.send_message(msg, from_addr, to_addrs)
+
+    data = _BARE_EOL.sub(_CRLF, msg.as_bytes(policy=msg.policy.clone(linesep="\r\n")))
+    mail_opts = f" SIZE={len(data)}" if "size" in features else ""
+
+    commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}{mail_opts}"]
+    commands += [f"RCPT TO:{smtplib.quoteaddr(addr)}" for addr in to_addrs]
+    commands.append("DATA")
+    server.send("".join(cmd + "\r\n" for cmd in commands))
+
+    # Replies arrive in command order; all of them must be drained before
+    # the session can be reused, even when an early command was rejected.
+    mail_code, mail_resp = server.getreply()
+    refused = {}
+    for addr in to_addrs:
+        code, resp = server.getreply()
+        if code not in (250, 251):
+            refused[addr] = (code, resp)
+    data_code, data_resp = server.getreply()
+
+    if mail_code != 250 or len(refused) == len(to_addrs) or data_code != 354:
+        _abort(server, data_code)
+        if mail_code != 250:
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+        if len(refused) == len(to_addrs):
+            raise smtplib.SMTPRecipientsRefused(refused)
+        raise smtplib.SMTPDataError(data_code, data_resp)
+
+    payload = _LEADING_DOT.sub(b"..", data)
+    if not payload.endswith(_CRLF):
+        payload += _CRLF
+    server.send(payload + b"." + _CRLF)
+    code, resp = server.getreply()
+    if code != 250:
+        _abort(server, None)
+        raise smtplib.SMTPDataError(code, resp)
+    return refused
+
+
+def _abort(server: smtplib.SMTP, data_code: int | None) -> None:
+    """Reset the transaction after a rejected pipelined envelope."""
+    if data_code == 354:
+        # The server is already waiting for message data; there is no way to
+        # cancel DATA without delivering something, so drop the session.
+        server.close()
+        return
+    try:
+        server.rset()
+    except smtplib.SMTPServerDisconnected:
+        logger.debug("SMTP server disconnected while resetting transaction")
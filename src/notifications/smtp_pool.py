@@ -0,0 +1,182 @@
+"""Bounded pool of authenticated SMTP sessions shared by notification sends."""
+
+import logging
+import queue
+import smtplib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledConnection:
+    server: smtplib.SMTP
+    sent: int = 0   # messages sent over this session since it was opened
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SMTPPool:
+    """Thread-safe pool of at most *size* authenticated SMTP sessions.
+
+    Sessions are opened lazily via *connect* and health-checked with ``NOOP``
+    before reuse.  ``acquire()`` blocks while all sessions are checked out.
+    A session is recycled (QUIT + reconnect on next use) once it has carried
+    *max_messages* messages, keeping long-lived connections within provider
+    per-connection limits.
+
+    Sessions left idle for longer than *idle_timeout* seconds are closed by a
+    background reaper thread, which runs only while idle sessions exist.
+    Pass ``idle_timeout=None`` to keep idle sessions open indefinitely.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], smtplib.SMTP],
+        size: int = 2,
+        max_messages: int = 100,
+        idle_timeout: float | None = 60.0,
+    ) -> None:
+        self._connect = connect
+        self._max_messages = max_messages
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+        # One slot per allowed connection; None marks a slot with no open session.
+        # LIFO so the most recently used (warmest) session is handed out first.
+        self._slots: queue.LifoQueue[PooledConnection | None] = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._slots.put(None)
+
+    def acquire(self) -> PooledConnection:
+        """Check out a live session, opening or replacing one if necessary."""
+        conn = self._slots.get()
+        try:
+            if conn is not None and self._is_stale(conn, time.monotonic()):
+                # The server has most likely timed the session out already;
+                # drop it without waiting on a QUIT round-trip.
+                _close_quietly(conn.server)
+                conn = None
+            if conn is not None:
+                try:
+                    conn.server.noop()
+                    return conn
+                except (smtplib.SMTPException, OSError):
+                    logger.info("Pooled SMTP connection is no longer usable — reconnecting")
+                    _close_quietly(conn.server)
+            return PooledConnection(server=self._connect())
+        except BaseException:
+            # Hand the slot back so a failed connect does not shrink the pool.
+            self._slots.put(None)
+            raise
+
+    def release(self, conn: PooledConnection, ok: bool = True) -> None:
+        """Return *conn* to the pool.
+
+        Pass ``ok=False`` when the session failed mid-transaction; it is then
+        closed rather than reused.
+        """
+        if not ok:
+            _close_quietly(conn.server)
+            self._slots.put(None)
+            return
+
+        conn.sent += 1
+        if conn.sent >= self._max_messages:
+            _quit_quietly(conn.server)
+            self._slots.put(None)
+            return
+
+        conn.last_used = time.monotonic()
+        self._slots.put(conn)
+        if self._idle_timeout is not None:
+            self._ensure_reaper()
+
+    def reap_idle(self) -> int:
+        """QUIT idle sessions past *idle_timeout*; return how many idle sessions remain."""
+        stale, remaining = self._take_stale()
+        for conn in stale:
+            _quit_quietly(conn.server)
+        return remaining
+
+    def close(self) -> None:
+        """QUIT every idle session.
+
+        Sessions checked out at the time are unaffected and return to the pool
+        as usual; the pool stays usable and reconnects lazily.
+        """
+        idle = self._drain()
+        for _ in idle:
+            self._slots.put(None)
+        for conn in idle:
+            if conn is not None:
+                _quit_quietly(conn.server)
+
+    def _take_stale(self) -> tuple[list[PooledConnection], int]:
+        """Empty the slots of stale sessions and return them with the live count.
+
+        No network I/O: the slots go back before the caller QUITs the stale
+        sessions, so acquire() is never held up by a slow server.
+        """
+        now = time.monotonic()
+        stale: list[PooledConnection] = []
+        remaining = 0
+        for conn in self._drain():
+            if conn is not None and self._is_stale(conn, now):
+                stale.append(conn)
+                conn = None
+            if conn is not None:
+                remaining += 1
+            self._slots.put(conn)
+        return stale, remaining
+
+    def _drain(self) -> list[PooledConnection | None]:
+        """Take every idle slot out of the pool; the caller must put them back."""
+        idle: list[PooledConnection | None] = []
+        while True:
+            try:
+                idle.append(self._slots.get_nowait())
+            except queue.Empty:
+                return idle
+
+    def _is_stale(self, conn: PooledConnection, now: float) -> bool:
+        return self._idle_timeout is not None and now - conn.last_used >= self._idle_timeout
+
+    def _ensure_reaper(self) -> None:
+        with self._lock:
+            if self._reaper is None:
+                self._reaper = threading.Thread(
+                    target=self._reap_loop, name="smtp-pool-reaper", daemon=True
+                )
+                self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while True:
+            time.sleep(self._idle_timeout / 2)
+            # Checked under the lock so a concurrent release() either sees
+            # this thread still registered or starts a fresh one.  The QUITs
+            # happen after the lock is dropped.
+            with self._lock:
+                stale, remaining = self._take_stale()
+                if remaining == 0:
+                    self._reaper = None
+            for conn in stale:
+                _quit_quietly(conn.server)
+            if remaining == 0:
+                return
+
+
+def _quit_quietly(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        logger.debug("SMTP QUIT failed", exc_info=True)
+
+
+def _close_quietly(server: smtplib.SMTP) -> None:
+    try:
+        server.close()
+    except Exception:
+        pass
@@ -14,24 +14,47 @@ Directory layout::
         parent_at_example.com/
           v1_2024-09-15T10-30-00Z.json   # initial registration
           v2_2024-10-03T14-22-10Z.json   # updated registration
-          current.json                    # copy of the latest version
+          current.json -> v2_2024-10-03T14-22-10Z.json   # latest version
 """
 
 import json
 import logging
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from ..models.conversation import ConversationState
 
 logger = logging.getLogger(__name__)
 
+# Parsed conversation files kept by ConversationStore.load(), least recently
+# used evicted first.
+_LOAD_CACHE_SIZE = 512
+
+_O_BINARY = getattr(os, "O_BINARY", 0)  # Windows only
+
+# Directory scans with more files than this read them on a small thread pool.
+_PARALLEL_READ_THRESHOLD = 32
+_READ_WORKERS = 8
+
+# Top-level "completed": true in a conversation file.  Quotes inside string
+# values are escaped in JSON, so message text cannot produce a match.
+_COMPLETED_TRUE = re.compile(rb'"completed"\s*:\s*true')
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Both helpers run several times per message (load, save, path building) for
+# the same handful of active senders.
+@lru_cache(maxsize=1024)
 def normalize_email(email: str) -> str:
     """Return a canonical email address for matching and storage.
 
@@ -40,12 +63,18 @@ def normalize_email(email: str) -> str:
     return email.strip().lower()
 
 
+# Single-pass mapping for filename stems; path separators are neutralised so
+# a crafted sender address cannot point outside the data directory.
+_FILENAME_SAFE = str.maketrans({"@": "_at_", "/": "_", "\\": "_"})
+
+
+@lru_cache(maxsize=1024)
 def _email_to_filename(email: str) -> str:
     """Convert a normalized email address to a safe filename stem.
 
     ``parent@example.com`` → ``parent_at_example.com``
     """
-    return normalize_email(email).replace("@", "_at_")
+    return normalize_email(email).translate(_FILENAME_SAFE)
 
 
 def _now() -> str:
@@ -54,34 +83,150 @@ def _now() -> str:
 
 def _timestamp_for_filename() -> str:
     """Return a filesystem-safe ISO-8601-ish timestamp (no colons)."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
+    # Whole seconds only, so a struct_time is enough; no datetime needed.
+    return time.strftime("%Y-%m-%dT%H-%M-%SZ", time.gmtime())
 
 
-def _diff_registrations(old: dict, new: dict) -> dict[str, tuple]:
-    """Return a mapping of field_path → (old_value, new_value) for changed fields."""
-    changes: dict[str, tuple] = {}
+def _dumps(obj: dict, pretty: bool = False) -> bytes:
+    """Serialise *obj* as UTF-8 JSON, compact unless *pretty* (2-space indent)."""
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    # json.loads detects the UTF-8 encoding of bytes input itself, so files
+    # are read without a text wrapper.
+    return json.loads(raw)
+
 
-    def _flatten(d: dict, prefix: str = "") -> dict:
-        out: dict = {}
-        for k, v in d.items():
-            key = f"{prefix}.{k}" if prefix else k
-            if isinstance(v, dict):
-                out.update(_flatten(v, key))
-            else:
-                out[key] = v
-        return out
+def _copy_json(obj):
+    """Deep-copy parsed JSON (dicts, lists, scalars); much cheaper than deepcopy."""
+    if type(obj) is dict:
+        return {k: _copy_json(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_copy_json(v) for v in obj]
+    return obj
 
-    old_flat = _flatten(old)
-    new_flat = _flatten(new)
 
-    all_keys = set(old_flat) | set(new_flat)
-    for key in sorted(all_keys):
-        o = old_flat.get(key)
-        n = new_flat.get(key)
-        if o != n:
-            changes[key] = (o, n)
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* so readers see either the old or the new file.
+
+    The bytes go to a temporary file next to *path*, which is then renamed
+    over it; a crash mid-write leaves the previous version intact.
+    """
+    tmp = _tmp_path(path)
+    try:
+        # Unbuffered: the payload is already complete, so hand it to the
+        # kernel directly rather than through a BufferedWriter.
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _atomic_symlink(path: Path, target: str) -> None:
+    """Point *path* at *target* (relative to its directory), replacing it atomically."""
+    tmp = _tmp_path(path)
+    tmp.unlink(missing_ok=True)  # left behind by a crash between the two steps
+    os.symlink(target, tmp)
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _tmp_path(path: Path) -> Path:
+    # Unique per writer, and not matching *.json, so listings never see it.
+    return path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def _read_files(paths: list[Path]) -> list[bytes | None]:
+    """Read every file in *paths*, in order; ``None`` where a read failed.
+
+    Large directories are read on a thread pool so that open/read latency
+    overlaps (file reads release the GIL).  Parsing stays with the caller,
+    as the json module holds the GIL throughout.
+    """
+    if len(paths) <= _PARALLEL_READ_THRESHOLD:
+        return [_read_or_none(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS, thread_name_prefix="store-read") as pool:
+        return list(pool.map(_read_or_none, paths))
+
+
+def _read_or_none(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _version_number(name: str) -> int:
+    """``v12_2024-10-03T14-22-10Z.json`` → 12, so v10 sorts after v9."""
+    head = name[1:].split("_", 1)[0]
+    return int(head) if head.isdigit() else 0
+
+
+def _signature(paths: list[Path]) -> tuple:
+    """Return a cheap change marker for *paths*: name, mtime and size of each.
+
+    Used to revalidate cached listings with one ``stat`` per file instead of
+    re-reading and re-parsing every file.
+    """
+    sig = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        sig.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _diff_registrations(old: dict, new: dict) -> dict[str, tuple]:
+    """Return a mapping of field_path → (old_value, new_value) for changed fields.
 
-    return changes
+    Field paths are dotted (``child.fullName``) and emitted in sorted order.
+    A missing field compares equal to ``None``.
+    """
+    changes: dict[str, tuple] = {}
+    _diff_into(changes, old, new, "")
+    # Sorted on the full dotted path, so "a-b" comes before "a.x".
+    return dict(sorted(changes.items()))
+
+
+def _diff_into(changes: dict[str, tuple], old, new, path: str) -> None:
+    # Equal subtrees are skipped with a single comparison; an update usually
+    # touches only one or two fields.
+    if old == new:
+        return
+    old_is_dict = isinstance(old, dict)
+    new_is_dict = isinstance(new, dict)
+    if not (old_is_dict or new_is_dict):
+        changes[path] = (old, new)
+        return
+    # A dict on one side only: the other side's scalar is a field of its own,
+    # and every field in the dict compares against a missing value.
+    if not old_is_dict:
+        if old is not None:
+            changes[path] = (old, None)
+        old = {}
+    elif not new_is_dict:
+        if new is not None:
+            changes[path] = (None, new)
+        new = {}
+    for key in old.keys() | new.keys():
+        _diff_into(
+            changes, old.get(key), new.get(key), f"{path}.{key}" if path else key
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -96,6 +241,16 @@ class ConversationStore:
         self._registrations_dir = data_dir / "registrations"
         self._conversations_dir.mkdir(parents=True, exist_ok=True)
         self._registrations_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed listings, each stored with the _signature() it was read at.
+        # Writes through this store drop them; changes made by other
+        # processes are picked up when the signature no longer matches.
+        # Like load(), every call hands out fresh objects built from them.
+        self._incomplete_cache: tuple[tuple, list[dict]] | None = None
+        self._registrations_cache: tuple[tuple, list[dict]] | None = None
+        self._history_cache: dict[str, tuple[tuple, list[dict]]] = {}
+        # path → ((mtime_ns, size), parsed JSON) for load(); each hit still
+        # builds a fresh ConversationState, so callers may mutate it freely.
+        self._load_cache: OrderedDict[Path, tuple[tuple[int, int], dict]] = OrderedDict()
 
     # ------------------------------------------------------------------
     # Conversation CRUD — keyed by normalized email address
@@ -104,11 +259,20 @@ class ConversationStore:
     def load(self, email_address: str) -> ConversationState | None:
         """Load a conversation by sender email address. Returns None if not found."""
         path = self._conversation_path(email_address)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return None
+        key = (st.st_mtime_ns, st.st_size)
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            return ConversationState.from_dict(data)
+            # pop + reinsert marks the entry most recently used.
+            cached = self._load_cache.pop(path, None)
+            if cached is None or cached[0] != key:
+                cached = (key, _loads(path.read_bytes()))
+            self._load_cache[path] = cached
+            while len(self._load_cache) > _LOAD_CACHE_SIZE:
+                self._load_cache.popitem(last=False)
+            return ConversationState.from_dict(cached[1])
         except Exception:
             logger.exception("Failed to load conversation for %s", email_address)
             return None
@@ -119,11 +283,11 @@ class ConversationStore:
     def save(self, state: ConversationState) -> None:
         """Persist a conversation state to disk."""
         path = self._conversation_path(state.parent_email or state.conversation_id)
+        self._incomplete_cache = None
+        self._load_cache.pop(path, None)
         try:
-            path.write_text(
-                json.dumps(state.to_dict(), ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            # Machine-only state rewritten on every turn: compact.
+            _atomic_write_bytes(path, _dumps(state.to_dict()))
         except Exception:
             logger.exception("Failed to save conversation for %s", state.conversation_id)
 
@@ -132,19 +296,36 @@ class ConversationStore:
         path = self._conversation_path(email_address)
         if path.exists():
             path.unlink()
+            self._incomplete_cache = None
+            self._load_cache.pop(path, None)
 
     def list_incomplete(self) -> list[ConversationState]:
-        """Return all conversations that have not yet been completed."""
-        states: list[ConversationState] = []
-        for path in self._conversations_dir.glob("*.json"):
-            try:
-                data = json.loads(path.read_text(encoding="utf-8"))
-                state = ConversationState.from_dict(data)
-                if not state.completed:
-                    states.append(state)
-            except Exception:
-                logger.warning("Could not read conversation file %s", path)
-        return states
+        """Return all conversations that have not yet been completed.
+
+        Parsed files are cached until a conversation file changes.
+        """
+        # scandir hands back names and file types without a stat per entry.
+        with os.scandir(self._conversations_dir) as entries:
+            paths = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+        sig = _signature(paths)
+        if self._incomplete_cache is None or self._incomplete_cache[0] != sig:
+            incomplete: list[dict] = []
+            for path, raw in zip(paths, _read_files(paths)):
+                # Most files are finished conversations; skip them unparsed.
+                if raw is not None and _COMPLETED_TRUE.search(raw):
+                    continue
+                try:
+                    data = _loads(raw)
+                    if not ConversationState.from_dict(data).completed:
+                        incomplete.append(data)
+                except Exception:
+                    logger.warning("Could not read conversation file %s", path)
+            self._incomplete_cache = (sig, incomplete)
+        return [ConversationState.from_dict(data) for data in self._incomplete_cache[1]]
 
     # ------------------------------------------------------------------
     # Versioned registration storage
@@ -185,8 +366,7 @@ class ConversationStore:
         reg_dir = self._registrations_dir / email_key
         reg_dir.mkdir(parents=True, exist_ok=True)
 
-        history = self.get_registration_history(state.parent_email or state.conversation_id)
-        version = len(history) + 1
+        version = self._next_version(reg_dir)
 
         record = self._build_record(state.registration.to_dict(), version, state)
         record["metadata"]["changeSummary"] = {
@@ -198,19 +378,40 @@ class ConversationStore:
         return email_key, version
 
     def get_registration_history(self, email_address: str) -> list[dict]:
-        """Return all registration versions for an email address, oldest first."""
+        """Return all registration versions for an email address, oldest first.
+
+        Parsed versions are cached until a version is added.
+        """
         email_key = _email_to_filename(email_address)
         reg_dir = self._registrations_dir / email_key
-        if not reg_dir.exists():
+        try:
+            with os.scandir(reg_dir) as entries:
+                names = sorted(
+                    (
+                        entry.name
+                        for entry in entries
+                        if entry.name.startswith("v") and entry.name.endswith(".json")
+                    ),
+                    key=_version_number,
+                )
+        except FileNotFoundError:
             return []
 
+        paths = [reg_dir / name for name in names]
+        # Version files are never rewritten, so their names identify the set.
+        sig = tuple(names)
+        cached = self._history_cache.get(email_key)
+        if cached is not None and cached[0] == sig:
+            return [_copy_json(r) for r in cached[1]]
+
         records: list[dict] = []
-        for path in sorted(reg_dir.glob("v*.json")):
+        for path, raw in zip(paths, _read_files(paths)):
             try:
-                records.append(json.loads(path.read_text(encoding="utf-8")))
+                records.append(_loads(raw))
             except Exception:
                 logger.warning("Could not read registration version %s", path)
-        return records
+        self._history_cache[email_key] = (sig, records)
+        return [_copy_json(r) for r in records]
 
     def get_current_registration(self, email_address: str) -> dict | None:
         """Return the latest registration version for an email address."""
@@ -219,24 +420,34 @@ class ConversationStore:
         if not current_path.exists():
             return None
         try:
-            return json.loads(current_path.read_text(encoding="utf-8"))
+            return _loads(current_path.read_bytes())
         except Exception:
             logger.exception("Failed to load current registration for %s", email_address)
             return None
 
     def list_registrations(self) -> list[dict]:
-        """Return the current (latest) registration for every known email address."""
+        """Return the current (latest) registration for every known email address.
+
+        Parsed records are cached until a ``current.json`` changes.
+        """
+        with os.scandir(self._registrations_dir) as entries:
+            currents = sorted(
+                Path(entry.path, "current.json") for entry in entries if entry.is_dir()
+            )
+        sig = _signature(currents)
+        if self._registrations_cache is not None and self._registrations_cache[0] == sig:
+            return [_copy_json(r) for r in self._registrations_cache[1]]
+
         records: list[dict] = []
-        for email_dir in sorted(self._registrations_dir.iterdir()):
-            if not email_dir.is_dir():
+        for current in currents:
+            try:
+                records.append(_loads(current.read_bytes()))
+            except FileNotFoundError:
                 continue
-            current = email_dir / "current.json"
-            if current.exists():
-                try:
-                    records.append(json.loads(current.read_text(encoding="utf-8")))
-                except Exception:
-                    logger.warning("Could not read %s", current)
-        return records
+            except Exception:
+                logger.warning("Could not read %s", current)
+        self._registrations_cache = (sig, records)
+        return [_copy_json(r) for r in records]
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -259,13 +470,25 @@ class ConversationStore:
         return record
 
     @staticmethod
-    def _write_version(reg_dir: Path, version: int, record: dict) -> None:
+    def _next_version(reg_dir: Path) -> int:
+        # Counts version files by name; their contents are not needed.
+        with os.scandir(reg_dir) as entries:
+            return sum(
+                1 for e in entries if e.name.startswith("v") and e.name.endswith(".json")
+            ) + 1
+
+    def _write_version(self, reg_dir: Path, version: int, record: dict) -> None:
+        self._registrations_cache = None
         ts = _timestamp_for_filename()
         version_path = reg_dir / f"v{version}_{ts}.json"
-        version_path.write_text(
-            json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
-        # Keep current.json as a plain copy of the latest version
-        (reg_dir / "current.json").write_text(
-            json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        # Registrations are the permanent record admins may open: indented.
+        payload = _dumps(record, pretty=True)
+        _atomic_write_bytes(version_path, payload)
+        # current.json is a relative symlink to the latest version, so the
+        # record is written once and the directory can be moved as a whole.
+        current = reg_dir / "current.json"
+        try:
+            _atomic_symlink(current, version_path.name)
+        except (OSError, NotImplementedError):
+            # No symlink support (e.g. Windows without the privilege).
+            _atomic_write_bytes(current, payload)
@@ -6,15 +6,19 @@ Covers four areas:
 - EmailAgent.process_message() — hard message-count cap (MAX_USER_MESSAGES)
 - AdminNotifier.notify_loop_escalation() — escalation email dispatch
 - EmailChannel.send_reply() — mid-registration emails must not carry admin Reply-To
+- EmailChannel.fetch_unread_messages() — automated messages are flagged without decoding the body
+- _strip_quoted_text() — quoted-reply removal at client reply separators
 """
 
 import email
+import email.policy
 import json
+from functools import lru_cache
 
 import pytest
 from unittest.mock import MagicMock, patch
 
-from src.channels.email_channel import detect_automated_message, EmailChannel
+from src.channels.email_channel import detect_automated_message, EmailChannel, _strip_quoted_text
 from src.agent.core import EmailAgent, MAX_USER_MESSAGES
 from src.models.conversation import ConversationState, ChatMessage
 from src.notifications.notifier import AdminNotifier
@@ -26,15 +30,9 @@ from src.notifications.notifier import AdminNotifier
 
 def _decode_body(msg_str: str) -> str:
     """Extract the decoded plain-text body from a raw MIME message string."""
-    parsed = email.message_from_string(msg_str)
-    if parsed.is_multipart():
-        for part in parsed.walk():
-            if part.get_content_type() == "text/plain":
-                payload = part.get_payload(decode=True)
-                if payload:
-                    return payload.decode(part.get_content_charset() or "utf-8")
-    payload = parsed.get_payload(decode=True)
-    return payload.decode(parsed.get_content_charset() or "utf-8") if payload else ""
+    parsed = email.message_from_string(msg_str, policy=email.policy.default)
+    body = parsed.get_body(preferencelist=("plain",))
+    return body.get_content() if body is not None else ""
 
 
 def _make_msg(
@@ -43,16 +41,27 @@ def _make_msg(
     extra_headers: dict | None = None,
     content_type: str = "text/plain",
 ) -> email.message.Message:
-    """Build a minimal parsed email.message.Message for testing detect_automated_message."""
-    raw = (
-        f"From: {from_addr}\r\n"
-        f"Subject: {subject}\r\n"
-        f"Content-Type: {content_type}\r\n"
-    )
+    """Build a minimal email.message.Message for testing detect_automated_message."""
+    # Built directly rather than formatted and re-parsed; the detector only
+    # reads headers and the content type.
+    msg = email.message.Message()
+    msg["From"] = from_addr
+    msg["Subject"] = subject
+    msg["Content-Type"] = content_type
     for key, value in (extra_headers or {}).items():
-        raw += f"{key}: {value}\r\n"
-    raw += "\r\nBody text"
-    return email.message_from_string(raw)
+        msg[key] = value
+    msg.set_payload("Body text")
+    return msg
+
+
+@lru_cache(maxsize=None)
+def _history(n: int) -> tuple[ChatMessage, ...]:
+    """*n* user/assistant turns, built once; ChatMessage is immutable, so shareable."""
+    return tuple(
+        ChatMessage(role=role, content=f"{label} {i + 1}")
+        for i in range(n)
+        for role, label in (("user", "Message"), ("assistant", "Reply"))
+    )
 
 
 def _state_with_n_user_messages(n: int, email_addr: str = "loop@example.com") -> ConversationState:
@@ -61,19 +70,14 @@ def _state_with_n_user_messages(n: int, email_addr: str = "loop@example.com") ->
         conversation_id=email_addr,
         parent_email=email_addr,
     )
-    for i in range(n):
-        state.messages.append(ChatMessage(role="user", content=f"Message {i + 1}"))
-        state.messages.append(ChatMessage(role="assistant", content=f"Reply {i + 1}"))
+    state.messages = list(_history(n))
     return state
 
 
-VALID_LLM_REPLY = json.dumps({
-    "reply": "Wie heisst dein Kind?",
-    "updates": {},
-    "next_step": "child_name",
-    "registration_complete": False,
-    "language": "de",
-})
+VALID_LLM_REPLY = (
+    '{"reply": "Wie heisst dein Kind?", "updates": {}, "next_step": "child_name", '
+    '"registration_complete": false, "language": "de"}'
+)
 
 
 # ---------------------------------------------------------------------------
@@ -158,42 +162,24 @@ def notifier_no_smtp():
 
 
 class TestDetectAutomatedMessageBySender:
-    def test_mailer_daemon_is_automated(self):
-        msg = _make_msg(from_addr="MAILER-DAEMON@tacitus2.sui-inter.net")
-        is_auto, reason = detect_automated_message(msg, "MAILER-DAEMON@tacitus2.sui-inter.net")
+    @pytest.mark.parametrize(
+        "from_addr",
+        [
+            "MAILER-DAEMON@tacitus2.sui-inter.net",
+            "mailer-daemon@example.com",
+            "postmaster@example.com",
+            "noreply@example.com",
+            "no-reply@example.com",
+            "donotreply@example.com",
+            "bounce@example.com",
+        ],
+    )
+    def test_automated_sender(self, from_addr):
+        msg = _make_msg(from_addr=from_addr)
+        is_auto, reason = detect_automated_message(msg, from_addr)
         assert is_auto is True
         assert reason != ""
 
-    def test_mailer_daemon_lowercase_is_automated(self):
-        msg = _make_msg(from_addr="mailer-daemon@example.com")
-        is_auto, _ = detect_automated_message(msg, "mailer-daemon@example.com")
-        assert is_auto is True
-
-    def test_postmaster_is_automated(self):
-        msg = _make_msg(from_addr="postmaster@example.com")
-        is_auto, _ = detect_automated_message(msg, "postmaster@example.com")
-        assert is_auto is True
-
-    def test_noreply_is_automated(self):
-        msg = _make_msg(from_addr="noreply@example.com")
-        is_auto, _ = detect_automated_message(msg, "noreply@example.com")
-        assert is_auto is True
-
-    def test_no_reply_hyphen_is_automated(self):
-        msg = _make_msg(from_addr="no-reply@example.com")
-        is_auto, _ = detect_automated_message(msg, "no-reply@example.com")
-        assert is_auto is True
-
-    def test_donotreply_is_automated(self):
-        msg = _make_msg(from_addr="donotreply@example.com")
-        is_auto, _ = detect_automated_message(msg, "donotreply@example.com")
-        assert is_auto is True
-
-    def test_bounce_is_automated(self):
-        msg = _make_msg(from_addr="bounce@example.com")
-        is_auto, _ = detect_automated_message(msg, "bounce@example.com")
-        assert is_auto is True
-
     def test_normal_parent_email_is_not_automated(self):
         msg = _make_msg(from_addr="anna.muster@example.com")
         is_auto, reason = detect_automated_message(msg, "anna.muster@example.com")
@@ -212,56 +198,36 @@ class TestDetectAutomatedMessageBySender:
 
 
 class TestDetectAutomatedMessageByHeaders:
-    def test_auto_submitted_auto_replied(self):
-        msg = _make_msg(extra_headers={"Auto-Submitted": "auto-replied"})
-        is_auto, reason = detect_automated_message(msg, "someone@example.com")
-        assert is_auto is True
-        assert "auto-replied" in reason
-
-    def test_auto_submitted_auto_generated(self):
-        msg = _make_msg(extra_headers={"Auto-Submitted": "auto-generated"})
-        is_auto, _ = detect_automated_message(msg, "someone@example.com")
-        assert is_auto is True
-
-    def test_auto_submitted_no_is_not_automated(self):
-        """Auto-Submitted: no means the message was composed by a human."""
-        msg = _make_msg(extra_headers={"Auto-Submitted": "no"})
-        is_auto, _ = detect_automated_message(msg, "parent@example.com")
-        assert is_auto is False
-
-    def test_x_auto_response_suppress_is_automated(self):
-        msg = _make_msg(extra_headers={"X-Auto-Response-Suppress": "All"})
-        is_auto, reason = detect_automated_message(msg, "someone@example.com")
-        assert is_auto is True
-        assert "X-Auto-Response-Suppress" in reason
-
-    def test_multipart_report_content_type_is_automated(self):
-        msg = _make_msg(content_type="multipart/report")
-        is_auto, reason = detect_automated_message(msg, "system@example.com")
-        assert is_auto is True
-        assert "multipart/report" in reason
-
-    def test_x_loop_header_is_automated(self):
-        msg = _make_msg(extra_headers={"X-Loop": "spielgruppen@familien-verein.ch"})
-        is_auto, reason = detect_automated_message(msg, "someone@example.com")
-        assert is_auto is True
-        assert "X-Loop" in reason
-
-    def test_precedence_bulk_is_automated(self):
-        msg = _make_msg(extra_headers={"Precedence": "bulk"})
-        is_auto, reason = detect_automated_message(msg, "list@example.com")
-        assert is_auto is True
-        assert "bulk" in reason
-
-    def test_precedence_junk_is_automated(self):
-        msg = _make_msg(extra_headers={"Precedence": "junk"})
-        is_auto, _ = detect_automated_message(msg, "spam@example.com")
+    @pytest.mark.parametrize(
+        "headers, content_type, from_addr, reason_part",
+        [
+            ({"Auto-Submitted": "auto-replied"}, "text/plain", "someone@example.com", "auto-replied"),
+            ({"Auto-Submitted": "auto-generated"}, "text/plain", "someone@example.com", "auto-generated"),
+            ({"X-Auto-Response-Suppress": "All"}, "text/plain", "someone@example.com", "X-Auto-Response-Suppress"),
+            ({}, "multipart/report", "system@example.com", "multipart/report"),
+            ({"X-Loop": "spielgruppen@familien-verein.ch"}, "text/plain", "someone@example.com", "X-Loop"),
+            ({"Precedence": "bulk"}, "text/plain", "list@example.com", "bulk"),
+            ({"Precedence": "junk"}, "text/plain", "spam@example.com", "junk"),
+        ],
+    )
+    def test_automated_header(self, headers, content_type, from_addr, reason_part):
+        msg = _make_msg(extra_headers=headers, content_type=content_type)
+        is_auto, reason = detect_automated_message(msg, from_addr)
         assert is_auto is True
-
-    def test_precedence_list_is_not_automated(self):
-        """Mailing list messages (Precedence: list) are not considered automated."""
-        msg = _make_msg(extra_headers={"Precedence": "list"})
-        is_auto, _ = detect_automated_message(msg, "newsletter@example.com")
+        assert reason_part in reason
+
+    @pytest.mark.parametrize(
+        "headers, from_addr",
+        [
+            # Auto-Submitted: no means the message was composed by a human.
+            ({"Auto-Submitted": "no"}, "parent@example.com"),
+            # Mailing list messages (Precedence: list) are not considered automated.
+            ({"Precedence": "list"}, "newsletter@example.com"),
+        ],
+    )
+    def test_human_header_is_not_automated(self, headers, from_addr):
+        msg = _make_msg(extra_headers=headers)
+        is_auto, _ = detect_automated_message(msg, from_addr)
         assert is_auto is False
 
 
@@ -271,48 +237,21 @@ class TestDetectAutomatedMessageByHeaders:
 
 
 class TestDetectAutomatedMessageBySubject:
-    def test_undelivered_mail_returned_to_sender(self):
-        msg = _make_msg(subject="Undelivered Mail Returned to Sender")
-        is_auto, reason = detect_automated_message(msg, "mailer@example.com")
-        # Caught by sender pattern first, but subject pattern must also flag it
-        # Test that a neutral sender + bounce subject is still flagged
-        msg2 = _make_msg(
-            from_addr="delivery@isp.example.com",
-            subject="Undelivered Mail Returned to Sender",
-        )
-        is_auto2, _ = detect_automated_message(msg2, "delivery@isp.example.com")
-        assert is_auto2 is True
-
-    def test_delivery_failed_subject(self):
-        msg = _make_msg(
-            from_addr="system@isp.example.com",
-            subject="Mail Delivery Failed",
-        )
-        is_auto, _ = detect_automated_message(msg, "system@isp.example.com")
-        assert is_auto is True
-
-    def test_out_of_office_subject(self):
-        msg = _make_msg(
-            from_addr="colleague@example.com",
-            subject="Out of Office: Re: Anmeldung",
-        )
-        is_auto, _ = detect_automated_message(msg, "colleague@example.com")
-        assert is_auto is True
-
-    def test_abwesenheitsnotiz_subject(self):
-        msg = _make_msg(
-            from_addr="colleague@example.com",
-            subject="Abwesenheitsnotiz: Anmeldung",
-        )
-        is_auto, _ = detect_automated_message(msg, "colleague@example.com")
-        assert is_auto is True
-
-    def test_automatische_antwort_subject(self):
-        msg = _make_msg(
-            from_addr="colleague@example.com",
-            subject="Automatische Antwort: Ihre Anfrage",
-        )
-        is_auto, _ = detect_automated_message(msg, "colleague@example.com")
+    @pytest.mark.parametrize(
+        "from_addr, subject",
+        [
+            ("delivery@isp.example.com", "Undelivered Mail Returned to Sender"),
+            ("system@isp.example.com", "Mail Delivery Failed"),
+            ("colleague@example.com", "Out of Office: Re: Anmeldung"),
+            ("colleague@example.com", "Abwesenheitsnotiz: Anmeldung"),
+            ("colleague@example.com", "Automatische Antwort: Ihre Anfrage"),
+            # Matching is case-insensitive.
+            ("system@isp.example.com", "UNDELIVERED MAIL RETURNED TO SENDER"),
+        ],
+    )
+    def test_automated_subject(self, from_addr, subject):
+        msg = _make_msg(from_addr=from_addr, subject=subject)
+        is_auto, _ = detect_automated_message(msg, from_addr)
         assert is_auto is True
 
     def test_normal_registration_subject_is_not_automated(self):
@@ -323,14 +262,6 @@ class TestDetectAutomatedMessageBySubject:
         is_auto, _ = detect_automated_message(msg, "parent@example.com")
         assert is_auto is False
 
-    def test_case_insensitive_subject_matching(self):
-        msg = _make_msg(
-            from_addr="system@isp.example.com",
-            subject="UNDELIVERED MAIL RETURNED TO SENDER",
-        )
-        is_auto, _ = detect_automated_message(msg, "system@isp.example.com")
-        assert is_auto is True
-
 
 # ---------------------------------------------------------------------------
 # EmailAgent.handle_automated_message — state and escalation
@@ -511,6 +442,10 @@ class TestProcessMessageCountCap:
 
         assert reply == ""
 
+    def test_valid_llm_reply_fixture_is_valid_json(self):
+        """Guards the hand-written VALID_LLM_REPLY literal against typos."""
+        assert json.loads(VALID_LLM_REPLY)["reply"] == "Wie heisst dein Kind?"
+
     def test_max_user_messages_constant_is_twenty(self):
         """The agreed-upon limit from the spec is 20 inbound messages."""
         assert MAX_USER_MESSAGES == 20
@@ -522,9 +457,32 @@ class TestProcessMessageCountCap:
 
 
 class TestNotifyLoopEscalation:
-    def test_sends_email_to_cc_recipients(self, notifier, mocker):
+    # smtplib.SMTP is patched once for the whole class; each test gets the
+    # same mock back with its calls, return value and side effects cleared.
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _patch_smtp(cls):
+        with patch("smtplib.SMTP") as m:
+            yield m
+
+    @pytest.fixture
+    def mock_smtp_cls(self, _patch_smtp):
+        _patch_smtp.reset_mock(return_value=True, side_effect=True)
+        return _patch_smtp
+
+    @pytest.fixture
+    def captured_msg(self, mock_smtp_cls):
+        """Dict that receives the sent message as a string under ``"msg"``."""
+        captured = {}
+
+        def fake_send_message(msg, from_addr=None, to_addrs=None):
+            captured["msg"] = msg.as_string()
+
+        mock_smtp_cls.return_value.send_message.side_effect = fake_send_message
+        return captured
+
+    def test_sends_email_to_cc_recipients(self, notifier, mock_smtp_cls):
         """The escalation alert is sent to the admin CC address list."""
-        mock_smtp_cls = mocker.patch("smtplib.SMTP")
         mock_server = mock_smtp_cls.return_value
 
         notifier.notify_loop_escalation(
@@ -534,21 +492,13 @@ class TestNotifyLoopEscalation:
             message_count=5,
         )
 
-        mock_server.sendmail.assert_called_once()
-        call_args = mock_server.sendmail.call_args
-        recipients = call_args[0][1]
+        mock_server.send_message.assert_called_once()
+        call_args = mock_server.send_message.call_args
+        recipients = call_args[0][2]
         assert "markus@example.com" in recipients
 
-    def test_subject_contains_warnung_tag(self, notifier, mocker):
+    def test_subject_contains_warnung_tag(self, notifier, captured_msg):
         """Subject must start with [WARNUNG] for easy filtering in the admin inbox."""
-        mock_smtp_cls = mocker.patch("smtplib.SMTP")
-        captured = {}
-
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
-
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
-
         notifier.notify_loop_escalation(
             sender_email="mailer-daemon@tacitus2.sui-inter.net",
             conversation_id="mailer-daemon@tacitus2.sui-inter.net",
@@ -556,27 +506,11 @@ class TestNotifyLoopEscalation:
             message_count=3,
         )
 
-        import email as email_mod
-        from email.header import decode_header
-        parsed = email_mod.message_from_string(captured["msg"])
-        raw_subject = parsed.get("Subject", "")
-        parts = decode_header(raw_subject)
-        subject = "".join(
-            chunk.decode(enc or "utf-8") if isinstance(chunk, bytes) else chunk
-            for chunk, enc in parts
-        )
-        assert "[WARNUNG]" in subject
+        parsed = email.message_from_string(captured_msg["msg"], policy=email.policy.default)
+        assert "[WARNUNG]" in parsed["Subject"]
 
-    def test_subject_contains_sender_address(self, notifier, mocker):
+    def test_subject_contains_sender_address(self, notifier, captured_msg):
         """The sender address appears in the subject for quick identification."""
-        mock_smtp_cls = mocker.patch("smtplib.SMTP")
-        captured = {}
-
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
-
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
-
         notifier.notify_loop_escalation(
             sender_email="mailer-daemon@tacitus2.sui-inter.net",
             conversation_id="mailer-daemon@tacitus2.sui-inter.net",
@@ -584,18 +518,10 @@ class TestNotifyLoopEscalation:
             message_count=3,
         )
 
-        assert "mailer-daemon@tacitus2.sui-inter.net" in captured["msg"]
+        assert "mailer-daemon@tacitus2.sui-inter.net" in captured_msg["msg"]
 
-    def test_body_contains_reason(self, notifier, mocker):
+    def test_body_contains_reason(self, notifier, captured_msg):
         """The email body includes the specific detection reason."""
-        mock_smtp_cls = mocker.patch("smtplib.SMTP")
-        captured = {}
-
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
-
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
-
         notifier.notify_loop_escalation(
             sender_email="test@example.com",
             conversation_id="test@example.com",
@@ -603,19 +529,11 @@ class TestNotifyLoopEscalation:
             message_count=7,
         )
 
-        body = _decode_body(captured["msg"])
+        body = _decode_body(captured_msg["msg"])
         assert "multipart/report" in body
 
-    def test_body_contains_message_count(self, notifier, mocker):
+    def test_body_contains_message_count(self, notifier, captured_msg):
         """The email body reports the number of messages exchanged."""
-        mock_smtp_cls = mocker.patch("smtplib.SMTP")
-        captured = {}
-
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
-
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
-
         notifier.notify_loop_escalation(
             sender_email="test@example.com",
             conversation_id="test@example.com",
@@ -623,13 +541,11 @@ class TestNotifyLoopEscalation:
             message_count=12,
         )
 
-        body = _decode_body(captured["msg"])
+        body = _decode_body(captured_msg["msg"])
         assert "12" in body
 
-    def test_no_cc_emails_skips_smtp(self, notifier_no_cc, mocker):
+    def test_no_cc_emails_skips_smtp(self, notifier_no_cc, mock_smtp_cls):
         """When no admin CC email is configured, no SMTP connection is made."""
-        mock_smtp_cls = mocker.patch("smtplib.SMTP")
-
         notifier_no_cc.notify_loop_escalation(
             sender_email="mailer-daemon@tacitus2.sui-inter.net",
             conversation_id="mailer-daemon@tacitus2.sui-inter.net",
@@ -639,10 +555,8 @@ class TestNotifyLoopEscalation:
 
         mock_smtp_cls.assert_not_called()
 
-    def test_no_smtp_host_skips_send(self, notifier_no_smtp, mocker):
+    def test_no_smtp_host_skips_send(self, notifier_no_smtp, mock_smtp_cls):
         """Dev mode (no SMTP host): email is logged but not dispatched."""
-        mock_smtp_cls = mocker.patch("smtplib.SMTP")
-
         notifier_no_smtp.notify_loop_escalation(
             sender_email="mailer-daemon@tacitus2.sui-inter.net",
             conversation_id="mailer-daemon@tacitus2.sui-inter.net",
@@ -690,3 +604,85 @@ class TestSendReplyNoAdminReplyTo:
 
         parsed = email.message_from_string(captured["msg"])
         assert parsed.get("Reply-To") is None
+
+
+# ---------------------------------------------------------------------------
+# EmailChannel.fetch_unread_messages — automated messages skip body decoding
+# ---------------------------------------------------------------------------
+
+
+class TestFetchUnreadAutomated:
+    @pytest.fixture
+    def channel(self):
+        return EmailChannel(
+            imap_host="imap.example.com",
+            imap_port=993,
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            username="agent@example.com",
+            password="secret",
+            use_ssl=True,
+            use_tls=True,
+            registration_email="agent@example.com",
+        )
+
+    def _fetch(self, channel, mocker, raw: bytes) -> list[dict]:
+        imap = MagicMock()
+        imap.search.return_value = ("OK", [b"1"])
+        imap.fetch.return_value = ("OK", [(b"1 (RFC822)", raw)])
+        mocker.patch.object(channel, "_connect_imap", return_value=imap)
+        return channel.fetch_unread_messages()
+
+    def test_bounce_is_flagged_without_decoding_body(self, channel, mocker):
+        raw = (
+            b"From: MAILER-DAEMON@tacitus2.sui-inter.net\r\n"
+            b"Subject: Undelivered Mail Returned to Sender\r\n"
+            b"Content-Type: multipart/report; boundary=xyz\r\n\r\n"
+            b"--xyz\r\nContent-Type: text/plain\r\n\r\nDelivery failed.\r\n--xyz--\r\n"
+        )
+        extract = mocker.patch("src.channels.email_channel._extract_text")
+
+        messages = self._fetch(channel, mocker, raw)
+
+        extract.assert_not_called()
+        assert messages[0]["is_automated"] is True
+        assert messages[0]["from"] == "MAILER-DAEMON@tacitus2.sui-inter.net"
+
+    def test_parent_message_body_is_extracted(self, channel, mocker):
+        raw = (
+            b"From: parent@example.com\r\n"
+            b"Subject: Anmeldung\r\n"
+            b"Content-Type: text/plain; charset=utf-8\r\n\r\n"
+            b"Mein Kind heisst Mia.\r\n"
+        )
+
+        messages = self._fetch(channel, mocker, raw)
+
+        assert messages[0]["is_automated"] is False
+        assert messages[0]["body"].strip() == "Mein Kind heisst Mia."
+
+
+# ---------------------------------------------------------------------------
+# _strip_quoted_text — reply separators
+# ---------------------------------------------------------------------------
+
+
+class TestStripQuotedText:
+    @pytest.mark.parametrize(
+        "separator",
+        [
+            "-----",
+            "________________________________",
+            "===",
+            "On Mon, 3 Mar 2025, Anna <anna@example.com> wrote:",
+            "Am 03.03.2025 um 10:00 schrieb Anna <anna@example.com>:",
+            "-----Original Message-----",
+        ],
+    )
+    def test_stops_at_separator(self, separator):
+        text = f"Lena ist 3 Jahre alt.\n{separator}\nAlte Nachricht"
+        assert _strip_quoted_text(text) == "Lena ist 3 Jahre alt."
+
+    def test_drops_quoted_lines_and_keeps_the_rest(self):
+        text = "> Wie heisst dein Kind?\nLena\nOn the weekend we are away."
+        assert _strip_quoted_text(text) == "Lena\nOn the weekend we are away."
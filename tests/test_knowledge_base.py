@@ -6,17 +6,27 @@ from pathlib import Path
 from src.knowledge_base.loader import KnowledgeBase
 
 
+def _write_kb_files(directory: Path) -> Path:
+    (directory / "faq.md").write_text("# FAQ\nWann beginnt die Spielgruppe?\nIm August.")
+    (directory / "fees.md").write_text("# Fees\nCHF 130 per month.")
+    return directory
+
+
+@pytest.fixture(scope="module")
+def shared_kb_dir(tmp_path_factory) -> Path:
+    """Read-only knowledge-base directory, written once for the whole module."""
+    return _write_kb_files(tmp_path_factory.mktemp("kb"))
+
+
 @pytest.fixture
 def kb_dir(tmp_path) -> Path:
-    """A temporary knowledge-base directory with a couple of markdown files."""
-    (tmp_path / "faq.md").write_text("# FAQ\nWann beginnt die Spielgruppe?\nIm August.")
-    (tmp_path / "fees.md").write_text("# Fees\nCHF 130 per month.")
-    return tmp_path
+    """A per-test knowledge-base directory for tests that add files."""
+    return _write_kb_files(tmp_path)
 
 
 @pytest.fixture
-def kb(kb_dir) -> KnowledgeBase:
-    return KnowledgeBase(kb_dir)
+def kb(shared_kb_dir) -> KnowledgeBase:
+    return KnowledgeBase(shared_kb_dir)
 
 
 class TestKnowledgeBaseLoading:
@@ -30,11 +40,25 @@ class TestKnowledgeBaseLoading:
         assert "CHF 130" in content
         assert "Spielgruppe" in content
 
-    def test_reload_picks_up_new_file(self, kb, kb_dir):
+    def test_reload_picks_up_new_file(self, kb_dir):
+        kb = KnowledgeBase(kb_dir)
         (kb_dir / "schedule.md").write_text("# Schedule\nMonday 9:00")
         kb.reload()
         assert "Schedule" in kb.get_all()
 
+    def test_get_all_caches_across_calls(self, kb_dir, mocker):
+        kb = KnowledgeBase(kb_dir)
+        spy = mocker.spy(kb, "_join")
+        assert kb.get_all() is kb.get_all()
+        assert spy.call_count == 1
+
+    def test_reload_invalidates_cached_content(self, kb_dir):
+        kb = KnowledgeBase(kb_dir)
+        kb.get_all()
+        (kb_dir / "fees.md").write_text("# Fees\nCHF 150 per month.")
+        kb.reload()
+        assert "CHF 150" in kb.get_all()
+
     def test_empty_directory_returns_empty_string(self, tmp_path):
         kb = KnowledgeBase(tmp_path)
         assert kb.get_all() == "" or isinstance(kb.get_all(), str)
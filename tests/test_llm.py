@@ -18,58 +18,57 @@ def _make_async_mock(mocker, content: str):
 
 
 class TestLlmComplete:
-    def test_returns_model_reply(self, mocker):
+    @pytest.fixture
+    def response(self, mocker):
         mock_response = mocker.MagicMock()
-        mock_response.choices[0].message.content = "Hallo! Wie heisst dein Kind?"
-        mocker.patch("litellm.completion", return_value=mock_response)
+        mock_response.choices[0].message.content = "ok"
+        return mock_response
+
+    @pytest.fixture(autouse=True)
+    def captured(self, mocker, response):
+        """Patch litellm.completion and collect the kwargs of every call."""
+        calls: list[dict] = []
+
+        def _completion(**kwargs):
+            calls.append(kwargs)
+            return response
+
+        mocker.patch("litellm.completion", side_effect=_completion)
+        return calls
+
+    def test_returns_model_reply(self, response):
+        response.choices[0].message.content = "Hallo! Wie heisst dein Kind?"
 
         result = llm.complete("anthropic/claude-opus-4-6", "system prompt", [])
 
         assert result == "Hallo! Wie heisst dein Kind?"
 
-    def test_passes_model_to_litellm(self, mocker):
-        mock_response = mocker.MagicMock()
-        mock_response.choices[0].message.content = "ok"
-        mock_completion = mocker.patch("litellm.completion", return_value=mock_response)
-
+    def test_passes_model_to_litellm(self, captured):
         llm.complete("openai/gpt-4o", "system", [])
 
-        call_kwargs = mock_completion.call_args.kwargs
-        assert call_kwargs["model"] == "openai/gpt-4o"
-
-    def test_system_prompt_prepended_as_system_message(self, mocker):
-        mock_response = mocker.MagicMock()
-        mock_response.choices[0].message.content = "ok"
-        mock_completion = mocker.patch("litellm.completion", return_value=mock_response)
+        assert captured[-1]["model"] == "openai/gpt-4o"
 
+    def test_system_prompt_prepended_as_system_message(self, captured):
         llm.complete("anthropic/claude-opus-4-6", "You are helpful.", [])
 
-        messages = mock_completion.call_args.kwargs["messages"]
+        messages = captured[-1]["messages"]
         assert messages[0] == {"role": "system", "content": "You are helpful."}
 
-    def test_chat_messages_appended_after_system(self, mocker):
-        mock_response = mocker.MagicMock()
-        mock_response.choices[0].message.content = "ok"
-        mock_completion = mocker.patch("litellm.completion", return_value=mock_response)
-
+    def test_chat_messages_appended_after_system(self, captured):
         chat = [
             ChatMessage(role="user", content="Hallo"),
             ChatMessage(role="assistant", content="Guten Tag"),
         ]
         llm.complete("anthropic/claude-opus-4-6", "system", chat)
 
-        messages = mock_completion.call_args.kwargs["messages"]
+        messages = captured[-1]["messages"]
         assert messages[1] == {"role": "user", "content": "Hallo"}
         assert messages[2] == {"role": "assistant", "content": "Guten Tag"}
 
-    def test_max_tokens_passed(self, mocker):
-        mock_response = mocker.MagicMock()
-        mock_response.choices[0].message.content = "ok"
-        mock_completion = mocker.patch("litellm.completion", return_value=mock_response)
-
+    def test_max_tokens_passed(self, captured):
         llm.complete("anthropic/claude-opus-4-6", "system", [])
 
-        assert mock_completion.call_args.kwargs["max_tokens"] == 2048
+        assert captured[-1]["max_tokens"] == 2048
 
     def test_litellm_exception_propagates(self, mocker):
         mocker.patch("litellm.completion", side_effect=RuntimeError("API error"))
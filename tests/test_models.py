@@ -1,5 +1,7 @@
 """Tests for data models: RegistrationData and ConversationState."""
 
+import dataclasses
+
 import pytest
 
 from src.models.registration import (
@@ -196,6 +198,12 @@ class TestConversationStateSerialization:
         assert d["messages"][0]["role"] == "user"
         assert "Hallo" in d["messages"][0]["content"]
 
+    def test_chat_message_is_immutable(self):
+        msg = ChatMessage(role="user", content="Hallo")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.content = "Tschüss"
+        assert not hasattr(msg, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # ConversationState — loop_escalated field
@@ -10,6 +10,7 @@ from src.notifications.notifier import AdminNotifier
 from src.notifications.context import (
     calculate_age,
     calculate_monthly_fee,
+    format_days,
     format_types,
     build_parent_context,
 )
@@ -82,6 +83,10 @@ class TestFormatTypes:
         result = format_types(["indoor", "outdoor"])
         assert len(result) > 0
 
+    def test_unknown_keys_are_ignored(self):
+        assert format_types(["indoor", "mystery"]) == format_types(["indoor"])
+        assert format_types([]) == "Spielgruppe"
+
 
 # ---------------------------------------------------------------------------
 # calculate_age
@@ -98,6 +103,40 @@ class TestCalculateAge:
         result = calculate_age("not-a-date")
         assert result == "not-a-date"
 
+    def test_dob_info_formats_date_and_age_together(self):
+        from src.notifications.context import dob_info
+
+        formatted, age = dob_info("2022-01-31")
+        assert formatted == "31.01.2022"
+        assert age == calculate_age("2022-01-31")
+
+    def test_dob_info_accepts_unpadded_date(self):
+        from src.notifications.context import dob_info
+
+        formatted, age = dob_info("2022-1-5")
+        assert formatted == "05.01.2022"
+        assert "Jahre" in age
+
+    def test_dob_info_invalid_returns_original(self):
+        from src.notifications.context import dob_info
+
+        assert dob_info("31.01.2022") == ("31.01.2022", "31.01.2022")
+
+
+class TestFormatDays:
+    def test_known_days_use_german_labels(self, complete_registration):
+        complete_registration.booking.selected_days = [
+            BookingDay(day="monday", type="indoor"),
+            BookingDay(day="thursday", type="outdoor"),
+        ]
+        assert format_days(complete_registration) == (
+            "Montag (Innenspielgruppe), Donnerstag (Waldspielgruppe)"
+        )
+
+    def test_unknown_day_falls_back_to_capitalised_key(self, complete_registration):
+        complete_registration.booking.selected_days = [BookingDay(day="friday", type="indoor")]
+        assert format_days(complete_registration) == "Friday (Innenspielgruppe)"
+
 
 # ---------------------------------------------------------------------------
 # calculate_monthly_fee
@@ -144,41 +183,390 @@ class TestCalculateMonthlyFee:
         fee = calculate_monthly_fee(complete_registration)
         assert "250" in fee
 
+    def test_fee_follows_in_place_booking_changes(self, complete_registration):
+        complete_registration.booking = Booking(
+            playgroup_types=["indoor"],
+            selected_days=[BookingDay(day="monday", type="indoor")],
+        )
+        assert "130" in calculate_monthly_fee(complete_registration)
+
+        complete_registration.booking.selected_days.append(
+            BookingDay(day="thursday", type="outdoor")
+        )
+        assert "380" in calculate_monthly_fee(complete_registration)
+
 
 # ---------------------------------------------------------------------------
-# _send — SMTP interaction
+# SMTP dispatch — pooled sessions
 # ---------------------------------------------------------------------------
 
 
+class TestSMTPPoolIdleTimeout:
+    def _pool(self, mocker, idle_timeout=60.0):
+        from src.notifications.smtp_pool import SMTPPool
+
+        connect = mocker.Mock(side_effect=lambda: mocker.MagicMock())
+        mocker.patch.object(SMTPPool, "_ensure_reaper")
+        return SMTPPool(connect, size=1, idle_timeout=idle_timeout), connect
+
+    def test_reap_idle_quits_stale_sessions(self, mocker):
+        pool, _ = self._pool(mocker)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.last_used -= 120
+
+        assert pool.reap_idle() == 0
+        conn.server.quit.assert_called_once()
+
+    def test_reaper_quits_outside_lock_with_slot_returned(self, mocker):
+        pool, _ = self._pool(mocker)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.last_used -= 120
+        seen = {}
+
+        def quit_():
+            seen["locked"] = pool._lock.locked()
+            seen["free_slots"] = pool._slots.qsize()
+
+        conn.server.quit.side_effect = quit_
+        mocker.patch("src.notifications.smtp_pool.time.sleep")
+
+        pool._reap_loop()
+
+        assert seen == {"locked": False, "free_slots": 1}
+        assert pool._reaper is None
+
+    def test_reap_idle_keeps_fresh_sessions(self, mocker):
+        pool, _ = self._pool(mocker)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        assert pool.reap_idle() == 1
+        conn.server.quit.assert_not_called()
+
+    def test_stale_session_replaced_without_noop(self, mocker):
+        pool, connect = self._pool(mocker)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.last_used -= 120
+
+        fresh = pool.acquire()
+
+        assert fresh is not conn
+        conn.server.noop.assert_not_called()
+        conn.server.close.assert_called_once()
+        assert connect.call_count == 2
+
+    def test_no_timeout_keeps_sessions(self, mocker):
+        pool, _ = self._pool(mocker, idle_timeout=None)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.last_used -= 10_000
+
+        assert pool.reap_idle() == 1
+        assert pool.acquire() is conn
+
+
+class TestRecipientsFor:
+    def test_routes_by_type(self, notifier):
+        assert notifier._recipients_for(["indoor"]) == ["andrea@example.com"]
+        assert notifier._recipients_for(["outdoor", "indoor"]) == [
+            "andrea@example.com",
+            "barbara@example.com",
+        ]
+
+    def test_missing_leader_email_is_skipped(self, notifier_no_smtp):
+        assert notifier_no_smtp._recipients_for(["indoor", "outdoor"]) == []
+
+    def test_unknown_type_keys_are_ignored(self, notifier):
+        assert notifier._recipients_for(["outdoor", "mystery"]) == ["barbara@example.com"]
+
+
+def _alert(notifier, subject: str = "Test") -> None:
+    """Send one CC-only notification through the public API."""
+    notifier.notify_loop_escalation(
+        sender_email=f"{subject}@example.com",
+        conversation_id="loop@example.com",
+        reason="automated sender",
+        message_count=3,
+    )
+
+
 class TestSend:
     def test_send_calls_smtp(self, notifier, mocker):
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
         mock_server = mock_smtp_cls.return_value
 
-        notifier._send(
-            to=["admin@example.com"],
-            cc=["cc@example.com"],
-            subject="Test",
-            body="Hello",
+        _alert(notifier)
+
+        mock_server.send_message.assert_called_once()
+
+    def test_send_includes_all_recipients(self, notifier, complete_registration, mocker):
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+        mock_server = mock_smtp_cls.return_value
+
+        notifier.notify_admin(
+            complete_registration,
+            registration_id="reg-1",
+            version=1,
+            conversation_id="parent@example.com",
+            channel="email",
+        )
+
+        call_args = mock_server.send_message.call_args
+        recipients = call_args[0][2]
+        assert "andrea@example.com" in recipients
+        assert "markus@example.com" in recipients
+
+    def test_send_reuses_connection(self, notifier, mocker):
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+        mock_server = mock_smtp_cls.return_value
+
+        _alert(notifier, "One")
+        _alert(notifier, "Two")
+
+        mock_smtp_cls.assert_called_once()
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+
+    def test_send_reconnects_when_connection_dropped(self, notifier, mocker):
+        import smtplib
+
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+        mock_server = mock_smtp_cls.return_value
+
+        _alert(notifier, "One")
+        mock_server.noop.side_effect = smtplib.SMTPServerDisconnected()
+        _alert(notifier, "Two")
+
+        assert mock_smtp_cls.call_count == 2
+        assert mock_server.send_message.call_count == 2
+
+    def test_connection_recycled_after_max_messages(self, mocker):
+        notifier = AdminNotifier(
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            username="agent@example.com",
+            password="secret",
+            cc_emails=["markus@example.com"],
+            max_messages_per_connection=2,
         )
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+        mock_server = mock_smtp_cls.return_value
 
-        mock_server.sendmail.assert_called_once()
+        for i in range(3):
+            _alert(notifier, f"n{i}")
 
-    def test_send_includes_all_recipients(self, notifier, mocker):
+        assert mock_smtp_cls.call_count == 2
+        mock_server.quit.assert_called_once()
+
+    def test_failed_send_discards_connection(self, notifier, mocker):
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+        mock_server = mock_smtp_cls.return_value
+        mock_server.send_message.side_effect = [RuntimeError("4xx"), None]
+
+        _alert(notifier, "One")
+        _alert(notifier, "Two")
+
+        assert mock_smtp_cls.call_count == 2
+        mock_server.close.assert_called_once()
+
+    def test_close_quits_cached_connection(self, notifier, mocker):
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
         mock_server = mock_smtp_cls.return_value
 
-        notifier._send(
-            to=["a@example.com"],
-            cc=["b@example.com"],
-            subject="Test",
-            body="Hello",
+        _alert(notifier)
+        notifier.close()
+
+        mock_server.quit.assert_called_once()
+
+
+class TestNotifyRegistrationUpdate:
+    def test_body_lists_changes_from_diff(self, notifier, complete_registration, mocker):
+        from src.storage.json_store import _diff_registrations
+
+        old = complete_registration.to_dict()
+        complete_registration.parent_guardian.phone = "044 999 99 99"
+        complete_registration.child.special_needs = "Allergie"
+        change_summary = _diff_registrations(old, complete_registration.to_dict())
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+
+        notifier.notify_registration_update(
+            complete_registration, "anna", 2, change_summary, "conv-1"
         )
 
-        call_args = mock_server.sendmail.call_args
-        recipients = call_args[0][1]
-        assert "a@example.com" in recipients
-        assert "b@example.com" in recipients
+        msg = mock_smtp_cls.return_value.send_message.call_args[0][0]
+        body = msg.get_content()
+        assert "Neu: 044 999 99 99" in body
+        assert body.index("child.specialNeeds") < body.index("parentGuardian.phone")
+
+
+class TestDryRun:
+    def test_notify_admin_skips_body_rendering(self, notifier_no_smtp, complete_registration, mocker):
+        mock_render = mocker.patch("src.notifications.notifier.render_template")
+        notifier_no_smtp._indoor_email = "andrea@example.com"
+
+        notifier_no_smtp.notify_admin(complete_registration, "reg-1", 1, "conv-1", "email")
+
+        mock_render.assert_not_called()
+
+    def test_body_logged_when_requested(self, complete_registration, caplog):
+        notifier = AdminNotifier(
+            smtp_host="",
+            smtp_port=587,
+            username="",
+            password="",
+            indoor_email="andrea@example.com",
+            dry_run_include_body=True,
+        )
+
+        with caplog.at_level("DEBUG", logger="src.notifications.notifier"):
+            notifier.notify_admin(complete_registration, "reg-1", 1, "conv-1", "email")
+
+        assert "conv-1" in caplog.text
+        assert complete_registration.child.full_name in caplog.text
+        assert "Notification body" in caplog.text
+
+
+class TestBackgroundDispatch:
+    @pytest.fixture
+    def background_notifier(self):
+        notifier = AdminNotifier(
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            username="agent@example.com",
+            password="secret",
+            from_email="agent@example.com",
+            indoor_email="andrea@example.com",
+            cc_emails=["markus@example.com"],
+            background=True,
+        )
+        yield notifier
+        notifier.close()
+
+    def test_notify_admin_returns_future(self, background_notifier, complete_registration, mocker):
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+
+        future = background_notifier.notify_admin(
+            complete_registration, "reg-1", 1, "conv-1", "email"
+        )
+
+        assert future is not None
+        future.result(timeout=5)
+        mock_smtp_cls.return_value.send_message.assert_called_once()
+
+    def test_close_waits_for_queued_sends(self, background_notifier, mocker):
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+
+        background_notifier.notify_loop_escalation("bot@example.com", "conv-1", "loop", 12)
+        background_notifier.close()
+
+        mock_smtp_cls.return_value.send_message.assert_called_once()
+
+    def test_unreferenced_notifier_is_shut_down(self, mocker):
+        import gc
+        import weakref
+
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+        notifier = AdminNotifier(
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            username="agent@example.com",
+            password="secret",
+            cc_emails=["markus@example.com"],
+            background=True,
+        )
+        notifier.notify_loop_escalation("bot@example.com", "conv-1", "loop", 12).result(timeout=5)
+        ref = weakref.ref(notifier)
+
+        del notifier
+        gc.collect()
+
+        assert ref() is None
+        mock_smtp_cls.return_value.quit.assert_called_once()
+
+    def test_synchronous_by_default(self, notifier, complete_registration, mocker):
+        mocker.patch("smtplib.SMTP")
+
+        assert notifier.notify_admin(complete_registration, "reg-1", 1, "conv-1", "email") is None
+
+
+class TestPipelinedSend:
+    @pytest.fixture
+    def pipelining_server(self, mocker):
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+        mock_server = mock_smtp_cls.return_value
+        mock_server.esmtp_features = {"pipelining": "", "size": "35882577"}
+        return mock_server
+
+    def test_envelope_sent_in_one_batch(self, notifier, complete_registration, pipelining_server):
+        pipelining_server.getreply.side_effect = [
+            (250, b"sender ok"),
+            (250, b"rcpt ok"),
+            (250, b"rcpt ok"),
+            (354, b"go ahead"),
+            (250, b"queued"),
+        ]
+
+        notifier.notify_admin(complete_registration, "reg-1", 1, "conv-1", "email")
+
+        pipelining_server.send_message.assert_not_called()
+        envelope = pipelining_server.send.call_args_list[0][0][0]
+        assert envelope.startswith("MAIL FROM:<agent@example.com> SIZE=")
+        assert "RCPT TO:<andrea@example.com>\r\nRCPT TO:<markus@example.com>\r\nDATA\r\n" in envelope
+        payload = pipelining_server.send.call_args_list[1][0][0]
+        assert payload.endswith(b"\r\n.\r\n")
+        assert pipelining_server.getreply.call_count == 5
+
+    def test_leading_dots_are_escaped(self, pipelining_server):
+        from email.message import EmailMessage
+        from email.policy import SMTP as SMTP_POLICY
+        from src.notifications.smtp_pipelining import send_pipelined
+
+        pipelining_server.getreply.side_effect = [(250, b""), (250, b""), (354, b""), (250, b"")]
+        msg = EmailMessage(policy=SMTP_POLICY)
+        msg["Subject"] = "Dots"
+        msg.set_content(".hidden line\n", cte="7bit")
+
+        send_pipelined(pipelining_server, msg, "agent@example.com", ["a@example.com"])
+
+        payload = pipelining_server.send.call_args_list[1][0][0]
+        assert b"\r\n..hidden line\r\n" in payload
+
+    def test_partial_refusal_still_delivers(self, pipelining_server):
+        from email.message import EmailMessage
+        from src.notifications.smtp_pipelining import send_pipelined
+
+        pipelining_server.getreply.side_effect = [
+            (250, b""),
+            (550, b"no such user"),
+            (250, b""),
+            (354, b""),
+            (250, b""),
+        ]
+        msg = EmailMessage()
+        msg.set_content("Hello")
+
+        refused = send_pipelined(
+            pipelining_server, msg, "agent@example.com", ["x@example.com", "a@example.com"]
+        )
+
+        assert refused == {"x@example.com": (550, b"no such user")}
+
+    def test_sender_refused_resets_and_raises(self, pipelining_server):
+        import smtplib
+        from email.message import EmailMessage
+        from src.notifications.smtp_pipelining import send_pipelined
+
+        pipelining_server.getreply.side_effect = [(550, b"denied"), (503, b""), (503, b"")]
+        msg = EmailMessage()
+        msg.set_content("Hello")
+
+        with pytest.raises(smtplib.SMTPSenderRefused):
+            send_pipelined(pipelining_server, msg, "agent@example.com", ["a@example.com"])
+        pipelining_server.rset.assert_called_once()
+        assert pipelining_server.send.call_count == 1
 
 
 # ---------------------------------------------------------------------------
@@ -199,7 +587,7 @@ class TestGetStrings:
         german = get_strings("de", "some-model")
         translated = {**german, "subject": "Registration Confirmation – Spielgruppe Pumuckl"}
         mock_litellm = mocker.patch("litellm.completion")
-        mock_litellm.return_value.choices[0].message.content = json.dumps(translated)
+        mock_litellm.return_value.choices[0].message.content = json.dumps(translated, default=dict)
 
         result = get_strings("en", "some-model")
 
@@ -210,7 +598,7 @@ class TestGetStrings:
         """The LLM is only called once per language per process lifetime."""
         german = get_strings("de", "some-model")
         mock_litellm = mocker.patch("litellm.completion")
-        mock_litellm.return_value.choices[0].message.content = json.dumps(german)
+        mock_litellm.return_value.choices[0].message.content = json.dumps(german, default=dict)
 
         get_strings("fr", "some-model")
         get_strings("fr", "some-model")
@@ -232,7 +620,7 @@ class TestGetStrings:
         without_passthrough = {k: v for k, v in german.items()
                                if k not in {"reg_fee_amount", "deposit_amount"}}
         mocker.patch("litellm.completion").return_value.choices[0].message.content = (
-            json.dumps(without_passthrough)
+            json.dumps(without_passthrough, default=dict)
         )
 
         result = get_strings("en", "some-model")
@@ -240,6 +628,17 @@ class TestGetStrings:
         assert result["reg_fee_amount"] == "CHF 80.00"
         assert result["deposit_amount"] == "CHF 50.00"
 
+    def test_german_table_is_shared_and_read_only(self):
+        """de.yaml is parsed once; callers cannot mutate the shared table."""
+        first = get_strings("de", "some-model")
+        second = get_strings("de", "some-model")
+
+        assert first is second
+        with pytest.raises(TypeError):
+            first["subject"] = "changed"
+        with pytest.raises(TypeError):
+            first["days"]["monday"] = "changed"
+
 
 # ---------------------------------------------------------------------------
 # notify_parent — parent confirmation email
@@ -254,20 +653,29 @@ class TestNotifyParent:
 
         notifier.notify_parent(complete_registration, language="de")
 
-        mock_server.sendmail.assert_called_once()
-        call_args = mock_server.sendmail.call_args
-        recipients = call_args[0][1]
+        mock_server.send_message.assert_called_once()
+        call_args = mock_server.send_message.call_args
+        recipients = call_args[0][2]
         assert "anna.muster@example.com" in recipients
 
+    def test_inline_send_skips_snapshot(self, notifier, complete_registration, mocker):
+        """Without a background executor the registration is used as-is."""
+        mocker.patch("smtplib.SMTP")
+        from_dict = mocker.spy(RegistrationData, "from_dict")
+
+        notifier.notify_parent(complete_registration, language="de")
+
+        from_dict.assert_not_called()
+
     def test_notify_parent_german_subject(self, notifier, complete_registration, mocker):
         """German language produces a German subject line without any LLM call."""
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
         captured = {}
 
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
+        def fake_send_message(msg, from_addr=None, to_addrs=None):
+            captured["msg"] = msg.as_string()
 
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
+        mock_smtp_cls.return_value.send_message.side_effect = fake_send_message
 
         notifier.notify_parent(complete_registration, language="de")
 
@@ -278,16 +686,16 @@ class TestNotifyParent:
         german = get_strings("de", "some-model")
         english = {**german, "subject": "Registration Confirmation – Spielgruppe Pumuckl"}
         mocker.patch("litellm.completion").return_value.choices[0].message.content = (
-            json.dumps(english)
+            json.dumps(english, default=dict)
         )
 
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
         captured = {}
 
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
+        def fake_send_message(msg, from_addr=None, to_addrs=None):
+            captured["msg"] = msg.as_string()
 
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
+        mock_smtp_cls.return_value.send_message.side_effect = fake_send_message
 
         notifier.notify_parent(complete_registration, language="en")
 
@@ -302,10 +710,10 @@ class TestNotifyParent:
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
         captured = {}
 
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
+        def fake_send_message(msg, from_addr=None, to_addrs=None):
+            captured["msg"] = msg.as_string()
 
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
+        mock_smtp_cls.return_value.send_message.side_effect = fake_send_message
 
         notifier.notify_parent(complete_registration, language="fr")
 
@@ -321,6 +729,47 @@ class TestNotifyParent:
 
         mock_smtp_cls.assert_not_called()
 
+    def test_notify_parent_no_smtp_skips_translation_and_qr(
+        self, notifier_no_smtp, complete_registration, mocker
+    ):
+        """Dev mode does not translate or render the QR-bill for a mail it won't send."""
+        mock_strings = mocker.patch("src.notifications.notifier.get_strings")
+        mock_qr = mocker.patch.object(AdminNotifier, "_generate_qr_bill_png")
+
+        notifier_no_smtp.notify_parent(complete_registration, language="en")
+
+        mock_strings.assert_not_called()
+        mock_qr.assert_not_called()
+
+    def test_notify_parent_embeds_qr_bill_inline(self, notifier, complete_registration, mocker):
+        """The QR-bill travels as an inline image related to the HTML part."""
+        mocker.patch.object(AdminNotifier, "_generate_qr_bill_png", return_value=b"\x89PNG")
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+
+        notifier.notify_parent(complete_registration, language="de")
+
+        msg = mock_smtp_cls.return_value.send_message.call_args[0][0]
+        assert msg.get_content_type() == "multipart/alternative"
+        plain, related = msg.get_payload()
+        assert plain.get_content_type() == "text/plain"
+        assert related.get_content_type() == "multipart/related"
+        html, image = related.get_payload()
+        assert html.get_content_type() == "text/html"
+        assert image["Content-ID"] == "<qrbill>"
+        assert image.get_content() == b"\x89PNG"
+
+    def test_qr_image_part_encoded_once(self, notifier, complete_registration, mocker):
+        """Consecutive confirmations attach the same pre-encoded QR-bill part."""
+        mocker.patch.object(AdminNotifier, "_generate_qr_bill_png", return_value=b"\x89PNG")
+        mock_smtp_cls = mocker.patch("smtplib.SMTP")
+
+        notifier.notify_parent(complete_registration, language="de")
+        notifier.notify_parent(complete_registration, language="de")
+
+        calls = mock_smtp_cls.return_value.send_message.call_args_list
+        images = [call[0][0].get_payload()[1].get_payload()[1] for call in calls]
+        assert images[0] is images[1]
+
     def test_text_body_contains_iban(self, complete_registration):
         """Rendered plain-text body includes the IBAN regardless of language."""
         strings = get_strings("de", "some-model")
@@ -328,6 +777,15 @@ class TestNotifyParent:
         text = render_template("parent_confirmation.txt.j2", ctx)
         assert "CH14" in text
 
+    def test_html_body_escapes_user_input(self, complete_registration):
+        """Parent-supplied values are HTML-escaped in the confirmation."""
+        complete_registration.child.special_needs = "<script>alert(1)</script>"
+        strings = get_strings("de", "some-model")
+        ctx = build_parent_context(complete_registration, strings, has_qr=False)
+        html = render_template("parent_confirmation.html.j2", ctx)
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+
 
 # ---------------------------------------------------------------------------
 # _generate_qr_bill_png
@@ -346,6 +804,38 @@ class TestGenerateQrBillPng:
         png = notifier._generate_qr_bill_png()
         assert png[:4] == b"\x89PNG"
 
+    def test_rendered_once_per_process(self, notifier, mocker):
+        """The fixed QR-bill is rendered on first use and then served from cache."""
+        import qrbill
+        from src.notifications import notifier as notifier_module
+
+        notifier_module._render_qr_bill_png.cache_clear()
+        spy = mocker.spy(qrbill, "QRBill")
+
+        first = notifier._generate_qr_bill_png()
+        second = notifier._generate_qr_bill_png()
+
+        assert first is second
+        assert spy.call_count == 1
+
+    def test_png_is_lossless_palette_image(self, notifier):
+        import io
+        from PIL import Image
+
+        img = Image.open(io.BytesIO(notifier._generate_qr_bill_png()))
+        assert img.mode == "P"
+        colors = {rgb for _, rgb in img.convert("RGB").getcolors()}
+        assert colors == {(0, 0, 0), (255, 255, 255), (255, 0, 0)}
+
+    def test_swiss_cross_stamp(self):
+        from src.notifications.notifier import _swiss_cross_stamp
+
+        stamp = _swiss_cross_stamp(40)
+        assert stamp.size == (41, 41)
+        assert stamp.getpixel((20, 20)) == (255, 0, 0)
+        assert stamp.getpixel((20, 0)) == (255, 0, 0)
+        assert stamp.getpixel((0, 0)) == (255, 255, 255)
+
 
 # ---------------------------------------------------------------------------
 # Reply-To header — confirmation email to parent (task 1.3)
@@ -360,10 +850,10 @@ class TestNotifyParentReplyTo:
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
         captured = {}
 
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
+        def fake_send_message(msg, from_addr=None, to_addrs=None):
+            captured["msg"] = msg.as_string()
 
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
+        mock_smtp_cls.return_value.send_message.side_effect = fake_send_message
 
         notifier.notify_parent(complete_registration, language="de")
 
@@ -385,10 +875,10 @@ class TestNotifyParentReplyTo:
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
         captured = {}
 
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
+        def fake_send_message(msg, from_addr=None, to_addrs=None):
+            captured["msg"] = msg.as_string()
 
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
+        mock_smtp_cls.return_value.send_message.side_effect = fake_send_message
 
         notifier_no_cc.notify_parent(complete_registration, language="de")
 
@@ -403,15 +893,15 @@ class TestNotifyParentReplyTo:
 
 class TestNotifyAdminReplyTo:
     def _capture_msg(self, mocker):
-        """Return a side-effect function and a dict that captures the raw MIME string."""
+        """Return a dict that captures the serialized MIME string of the sent message."""
         captured = {}
 
         mock_smtp_cls = mocker.patch("smtplib.SMTP")
 
-        def fake_sendmail(from_, to_, msg_str):
-            captured["msg"] = msg_str
+        def fake_send_message(msg, from_addr=None, to_addrs=None):
+            captured["msg"] = msg.as_string()
 
-        mock_smtp_cls.return_value.sendmail.side_effect = fake_sendmail
+        mock_smtp_cls.return_value.send_message.side_effect = fake_send_message
         return captured
 
     def test_indoor_notification_reply_to_is_parent_email(
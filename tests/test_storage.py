@@ -10,7 +10,7 @@ from src.storage.json_store import (
     normalize_email,
     _diff_registrations,
 )
-from src.models.conversation import ConversationState
+from src.models.conversation import ConversationState, ChatMessage
 
 
 # ---------------------------------------------------------------------------
@@ -53,6 +53,25 @@ class TestDiffRegistrations:
         diff = _diff_registrations(old, new)
         assert "parentGuardian.email" in diff
 
+    def test_subtree_missing_on_one_side_diffs_each_field(self):
+        old = {"child": {"fullName": "Lena"}, "metadata": {"version": 1}}
+        new = {"child": {"fullName": "Lena"}}
+        assert _diff_registrations(old, new) == {"metadata.version": (1, None)}
+
+    def test_fields_emitted_in_sorted_order(self):
+        old = {"parentGuardian": {"phone": "1", "city": "A"}, "child": {"fullName": "X"}}
+        new = {"parentGuardian": {"phone": "2", "city": "B"}, "child": {"fullName": "Y"}}
+        assert list(_diff_registrations(old, new)) == [
+            "child.fullName",
+            "parentGuardian.city",
+            "parentGuardian.phone",
+        ]
+
+    def test_order_is_by_full_dotted_path(self):
+        old = {"a": {"x": 1}, "a-b": 1}
+        new = {"a": {"x": 2}, "a-b": 2}
+        assert list(_diff_registrations(old, new)) == ["a-b", "a.x"]
+
 
 # ---------------------------------------------------------------------------
 # ConversationStore — CRUD
@@ -81,6 +100,28 @@ class TestConversationStoreCRUD:
         loaded = store.load(fresh_state.parent_email)
         assert loaded.language == "en"
 
+    def test_non_ascii_written_as_utf8(self, store, fresh_state, tmp_path):
+        fresh_state.parent_name = "Jörg Müller"
+        store.save(fresh_state)
+        raw = next((tmp_path / "conversations").glob("*.json")).read_bytes()
+        assert "Jörg Müller".encode("utf-8") in raw
+        assert store.load(fresh_state.parent_email).parent_name == "Jörg Müller"
+
+    def test_path_separators_stay_inside_data_dir(self, store, fresh_state, tmp_path):
+        fresh_state.parent_email = "../../evil@example.com"
+        store.save(fresh_state)
+        assert [p.name for p in (tmp_path / "conversations").iterdir()] == [
+            ".._.._evil_at_example.com.json"
+        ]
+
+    def test_failed_save_keeps_previous_file(self, store, fresh_state, tmp_path, mocker):
+        store.save(fresh_state)
+        mocker.patch("src.storage.json_store.os.replace", side_effect=OSError("disk full"))
+        fresh_state.language = "en"
+        store.save(fresh_state)
+        assert store.load(fresh_state.parent_email).language == "de"
+        assert [p.suffix for p in (tmp_path / "conversations").iterdir()] == [".json"]
+
     def test_delete_removes_conversation(self, store, fresh_state):
         store.save(fresh_state)
         store.delete(fresh_state.parent_email)
@@ -100,6 +141,18 @@ class TestConversationStoreCRUD:
         incomplete = store.list_incomplete()
         assert all(not s.completed for s in incomplete)
 
+    def test_list_incomplete_skips_completed_without_parsing(self, store, fresh_state, mocker):
+        fresh_state.completed = True
+        store.save(fresh_state)
+        loads = mocker.spy(json, "loads")
+        assert store.list_incomplete() == []
+        loads.assert_not_called()
+
+    def test_list_incomplete_ignores_marker_in_message_text(self, store, state_with_messages):
+        state_with_messages.messages[0] = ChatMessage(role="user", content='{"completed": true}')
+        store.save(state_with_messages)
+        assert len(store.list_incomplete()) == 1
+
     def test_find_by_email_is_alias_for_load(self, store, fresh_state):
         store.save(fresh_state)
         assert store.find_by_email(fresh_state.parent_email) is not None
@@ -126,6 +179,29 @@ class TestRegistrationVersioning:
         current = tmp_path / "registrations" / email_key / "current.json"
         assert current.exists()
 
+    def test_current_json_links_to_latest_version(self, store, fresh_state, complete_registration, tmp_path):
+        fresh_state.registration = complete_registration
+        fresh_state.completed = True
+        email_key, _ = store.save_registration(fresh_state)
+        store.save_registration_version(fresh_state, {"child.fullName": ("A", "B")})
+        reg_dir = tmp_path / "registrations" / email_key
+        current = reg_dir / "current.json"
+        assert current.is_symlink()
+        assert current.readlink().name.startswith("v2_")
+        assert json.loads(current.read_bytes())["metadata"]["version"] == 2
+        assert sorted(p.name[:2] for p in reg_dir.iterdir()) == ["cu", "v1", "v2"]
+
+    def test_current_json_copied_without_symlink_support(
+        self, store, fresh_state, complete_registration, tmp_path, mocker
+    ):
+        mocker.patch("src.storage.json_store.os.symlink", side_effect=OSError("unsupported"))
+        fresh_state.registration = complete_registration
+        fresh_state.completed = True
+        email_key, _ = store.save_registration(fresh_state)
+        current = tmp_path / "registrations" / email_key / "current.json"
+        assert not current.is_symlink()
+        assert store.get_current_registration(fresh_state.parent_email)["metadata"]["version"] == 1
+
     def test_save_registration_version_increments(self, store, fresh_state, complete_registration):
         fresh_state.registration = complete_registration
         fresh_state.completed = True
@@ -135,6 +211,18 @@ class TestRegistrationVersioning:
         )
         assert v2 == 2
 
+    def test_save_registration_version_does_not_parse_history(
+        self, store, fresh_state, complete_registration, mocker
+    ):
+        fresh_state.registration = complete_registration
+        fresh_state.completed = True
+        store.save_registration(fresh_state)
+        store.save_registration_version(fresh_state, {"child.fullName": ("A", "B")})
+        loads = mocker.spy(json, "loads")
+        _, v3 = store.save_registration_version(fresh_state, {"child.fullName": ("B", "C")})
+        assert v3 == 3
+        loads.assert_not_called()
+
     def test_get_current_registration_returns_latest(self, store, fresh_state, complete_registration):
         fresh_state.registration = complete_registration
         fresh_state.completed = True
@@ -151,6 +239,15 @@ class TestRegistrationVersioning:
         history = store.get_registration_history(fresh_state.parent_email)
         assert len(history) == 2
 
+    def test_history_orders_versions_numerically(self, store, fresh_state, complete_registration):
+        fresh_state.registration = complete_registration
+        fresh_state.completed = True
+        store.save_registration(fresh_state)
+        for i in range(10):
+            store.save_registration_version(fresh_state, {"child.fullName": (str(i), str(i + 1))})
+        history = store.get_registration_history(fresh_state.parent_email)
+        assert [r["metadata"]["version"] for r in history] == list(range(1, 12))
+
     def test_list_registrations_includes_saved(self, store, fresh_state, complete_registration):
         fresh_state.registration = complete_registration
         fresh_state.completed = True
@@ -174,3 +271,103 @@ class TestRegistrationVersioning:
         store.save_registration(fresh_state)
         current = store.get_current_registration(fresh_state.parent_email)
         assert current["metadata"]["language"] == "de"
+
+
+# ---------------------------------------------------------------------------
+# ConversationStore — cached listings
+# ---------------------------------------------------------------------------
+
+
+class TestListingCache:
+    def test_list_incomplete_reuses_parsed_files(self, store, fresh_state, mocker):
+        store.save(fresh_state)
+        store.list_incomplete()
+        loads = mocker.spy(json, "loads")
+        assert len(store.list_incomplete()) == 1
+        loads.assert_not_called()
+
+    def test_list_incomplete_states_are_independent(self, store, fresh_state):
+        store.save(fresh_state)
+        first = store.list_incomplete()[0]
+        first.reminder_count = 3  # e.g. a reminder job whose save() then fails
+        assert store.list_incomplete()[0].reminder_count == 0
+
+    def test_list_incomplete_sees_saves(self, store, fresh_state):
+        store.save(fresh_state)
+        assert len(store.list_incomplete()) == 1
+        fresh_state.completed = True
+        store.save(fresh_state)
+        assert store.list_incomplete() == []
+
+    def test_list_incomplete_sees_external_changes(self, store, fresh_state, tmp_path):
+        store.save(fresh_state)
+        assert len(store.list_incomplete()) == 1
+        path = next((tmp_path / "conversations").glob("*.json"))
+        data = json.loads(path.read_bytes())
+        data["completed"] = True
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert store.list_incomplete() == []
+
+    def test_list_incomplete_large_directory(self, store):
+        for i in range(40):
+            state = ConversationState(conversation_id=f"p{i:02d}@example.com")
+            state.parent_email = state.conversation_id
+            state.completed = i % 4 == 0
+            store.save(state)
+        incomplete = store.list_incomplete()
+        assert len(incomplete) == 30
+        assert [s.conversation_id for s in incomplete] == sorted(
+            s.conversation_id for s in incomplete
+        )
+
+    def test_history_picks_up_new_versions(self, store, fresh_state, complete_registration):
+        fresh_state.registration = complete_registration
+        fresh_state.completed = True
+        store.save_registration(fresh_state)
+        assert len(store.get_registration_history(fresh_state.parent_email)) == 1
+        store.save_registration_version(fresh_state, {"child.fullName": ("A", "B")})
+        assert len(store.get_registration_history(fresh_state.parent_email)) == 2
+
+    def test_list_registrations_sees_new_version(self, store, fresh_state, complete_registration):
+        fresh_state.registration = complete_registration
+        fresh_state.completed = True
+        store.save_registration(fresh_state)
+        assert store.list_registrations()[0]["metadata"]["version"] == 1
+        store.save_registration_version(fresh_state, {"child.fullName": ("A", "B")})
+        assert store.list_registrations()[0]["metadata"]["version"] == 2
+
+    def test_cached_registrations_are_independent(self, store, fresh_state, complete_registration):
+        fresh_state.registration = complete_registration
+        fresh_state.completed = True
+        store.save_registration(fresh_state)
+        store.list_registrations()[0]["child"]["fullName"] = "Changed"
+        store.get_registration_history(fresh_state.parent_email)[0]["child"]["fullName"] = "Changed"
+        assert store.list_registrations()[0]["child"]["fullName"] != "Changed"
+        assert store.get_registration_history(fresh_state.parent_email)[0]["child"]["fullName"] != "Changed"
+
+
+class TestLoadCache:
+    def test_repeat_load_skips_parse(self, store, fresh_state, mocker):
+        store.save(fresh_state)
+        store.load(fresh_state.parent_email)
+        loads = mocker.spy(json, "loads")
+        assert store.load(fresh_state.parent_email) is not None
+        loads.assert_not_called()
+
+    def test_loaded_states_are_independent(self, store, state_with_messages):
+        store.save(state_with_messages)
+        first = store.load(state_with_messages.parent_email)
+        first.messages.clear()
+        first.registration.booking.playgroup_types.append("indoor")
+        second = store.load(state_with_messages.parent_email)
+        assert len(second.messages) == len(state_with_messages.messages)
+        assert second.registration.booking.playgroup_types == []
+
+    def test_external_change_is_reloaded(self, store, fresh_state, tmp_path):
+        store.save(fresh_state)
+        store.load(fresh_state.parent_email)
+        path = next((tmp_path / "conversations").glob("*.json"))
+        data = json.loads(path.read_bytes())
+        data["language"] = "fr-CH"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert store.load(fresh_state.parent_email).language == "fr-CH"